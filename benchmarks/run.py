@@ -0,0 +1,275 @@
+"""
+Benchmarks of parsing, validity, scheme resolution and rhyme generation.
+
+    python -m benchmarks.run                  # print results as JSON
+    python -m benchmarks.run --save-baseline  # store them as the baseline
+    python -m benchmarks.run --compare        # fail on regressions
+
+Every benchmark runs over a corpus of syllables drawn from `PINYIN_LIST`,
+weighted by character count, for each of `--sizes`. The best of `--repeat`
+runs is reported in nanoseconds per operation. The stored baseline is only
+meaningful on the machine that recorded it, so re-record it before comparing
+elsewhere.
+
+`cold_import` times `import pinyin_rhymer` in a fresh interpreter, so that
+a regression pulling the syllable data into the import path shows up here
+rather than as a wall-clock assertion in the unit tests.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+
+from pinyin_rhymer.consonant import Consonant
+from pinyin_rhymer.data import pinyin_list
+from pinyin_rhymer.error import (
+    IrregularPinYinError, NotAConsonantError, NotAPinYinError, NotAVowelError
+)
+from pinyin_rhymer.pinyin import (
+    SYLLABLE_TABLE, PinYin, convert_unicode_to_alnum, match_pinyin
+)
+from pinyin_rhymer.rhyme_scheme import VowelScheme
+from pinyin_rhymer.vowel import Vowel
+
+BASELINE = Path(__file__).parent / 'baseline.json'
+SIZES = (1_000, 10_000)
+GENERATION_SIZES = (100,)
+IMPORT_SIZES = (1,)
+VOWEL_SCHEMES = (
+    VowelScheme.FOURTEEN_RHYMES,
+    VowelScheme.SIMILAR_BODY,
+    VowelScheme.SIMILAR_TAIL,
+    VowelScheme.SIMILAR_SOUNDING,
+    VowelScheme.SIMILAR_MOUTH_MOVEMENT,
+    VowelScheme.ADDITIVE,
+    VowelScheme.SUBTRACTIVE,
+)
+
+BENCHMARKS = {}
+
+
+def benchmark(name, sizes=SIZES):
+    def register(setup):
+        BENCHMARKS[name] = (setup, sizes)
+        return setup
+    return register
+
+
+def corpus(size, seed=0):
+    """
+    Tone-marked syllables sampled with their character count as weight.
+    """
+    syllables = []
+    weights = []
+    for (pinyin, zi) in pinyin_list.PINYIN_ZI_DICT.items():
+        try:
+            PinYin(pinyin)
+        except (
+            IrregularPinYinError, NotAPinYinError,
+            NotAConsonantError, NotAVowelError
+        ):
+            continue
+        syllables.append(pinyin)
+        weights.append(len(zi))
+    return random.Random(seed).choices(syllables, weights, k=size)
+
+
+def ascii_corpus(size):
+    return [str(PinYin(x)) for x in corpus(size)]
+
+
+@benchmark('cold_import', IMPORT_SIZES)
+def _cold_import(size):
+    command = [sys.executable, '-c', 'import pinyin_rhymer']
+    return lambda: [subprocess.run(command, check=True) for _ in range(size)]
+
+
+@benchmark('parse_ascii')
+def _parse_ascii(size):
+    tokens = ascii_corpus(size)
+    return lambda: [PinYin(x) for x in tokens]
+
+
+@benchmark('parse_tone_marked')
+def _parse_tone_marked(size):
+    tokens = corpus(size)
+    return lambda: [PinYin(x) for x in tokens]
+
+
+@benchmark('parse_fallback')
+def _parse_fallback(size):
+    tokens = corpus(size)
+    return lambda: [match_pinyin(x) for x in tokens]
+
+
+@benchmark('intern_tone_marked')
+def _intern_tone_marked(size):
+    tokens = corpus(size)
+    return lambda: [PinYin.intern(x) for x in tokens]
+
+
+@benchmark('convert_unicode_to_alnum')
+def _convert_unicode_to_alnum(size):
+    tokens = corpus(size)
+    return lambda: [convert_unicode_to_alnum(x) for x in tokens]
+
+
+@benchmark('is_valid')
+def _is_valid(size):
+    syllables = [PinYin(x) for x in corpus(size)]
+    return lambda: [x.is_valid for x in syllables]
+
+
+@benchmark('with_tone_mark')
+def _with_tone_mark(size):
+    syllables = [PinYin(x) for x in corpus(size)]
+    return lambda: [x.with_tone_mark() for x in syllables]
+
+
+@benchmark('resolve_consonant')
+def _resolve_consonant(size):
+    names = [str(PinYin(x).consonant) for x in corpus(size)]
+    return lambda: [Consonant(x) for x in names]
+
+
+@benchmark('resolve_vowel')
+def _resolve_vowel(size):
+    names = [PinYin(x).vowel.name for x in corpus(size)]
+    return lambda: [Vowel(x) for x in names]
+
+
+@benchmark('resolve_schemes')
+def _resolve_schemes(size):
+    syllables = [PinYin(x) for x in corpus(size)]
+    return lambda: [
+        x._resolve('FAMILY', 'FOURTEEN_RHYMES', 'ALL') for x in syllables
+    ]
+
+
+@benchmark('rhymes_with')
+def _rhymes_with(size):
+    syllables = [PinYin(x) for x in corpus(size)]
+    pairs = list(zip(syllables, reversed(syllables)))
+    return lambda: [x.rhymes_with(y, 'FAMILY') for (x, y) in pairs]
+
+
+def _vowel_rhyme(rhymescheme, compute):
+    def setup(size):
+        vowels = [PinYin(x).vowel for x in corpus(size)]
+        if compute:
+            return lambda: [x._rhyme(rhymescheme) for x in vowels]
+        return lambda: [x.rhyme(rhymescheme) for x in vowels]
+    return setup
+
+
+for _scheme in VOWEL_SCHEMES:
+    benchmark(f'vowel_rhyme.{_scheme.name}')(_vowel_rhyme(_scheme, False))
+    benchmark(
+        f'vowel_rhyme_uncached.{_scheme.name}', GENERATION_SIZES
+    )(_vowel_rhyme(_scheme, True))
+
+
+def _generate_rhymes(consonants, vowels):
+    def setup(size):
+        syllables = [PinYin(x) for x in corpus(size)]
+        return lambda: [
+            list(x.generate_rhymes(consonants, vowels, 'ALL'))
+            for x in syllables
+        ]
+    return setup
+
+
+for _consonants in ('ALL', 'FAMILY'):
+    for _scheme in (VowelScheme.FOURTEEN_RHYMES, VowelScheme.SIMILAR_SOUNDING):
+        benchmark(
+            f'generate_rhymes.{_consonants}.{_scheme.name}', GENERATION_SIZES
+        )(_generate_rhymes(_consonants, _scheme))
+
+
+def warm_up():
+    pinyin_list.load()
+    for vowel in Vowel:
+        for rhymescheme in VOWEL_SCHEMES:
+            vowel.rhyme(rhymescheme)
+    PinYin('a1').is_valid
+    SYLLABLE_TABLE.load()
+
+
+def run(names=None, sizes=None, repeat=5):
+    warm_up()
+    results = {}
+    for (name, (setup, default_sizes)) in BENCHMARKS.items():
+        if names and not any(name.startswith(x) for x in names):
+            continue
+        for size in sizes or default_sizes:
+            func = setup(size)
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            results[f'{name}[{size}]'] = {
+                'size': size,
+                'seconds': best,
+                'ns_per_op': best / size * 1e9,
+            }
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """
+    Names of the benchmarks slower than `tolerance` times their baseline.
+    """
+    regressions = []
+    for (name, result) in report['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        ratio = result['ns_per_op'] / reference['ns_per_op']
+        result['baseline_ratio'] = ratio
+        if ratio > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        'names', nargs='*', help='only run benchmarks with these prefixes'
+    )
+    parser.add_argument(
+        '--sizes', type=lambda x: [int(y) for y in x.split(',')],
+        help='comma separated corpus sizes, overriding the defaults'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=Path, help='write JSON here')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--compare', action='store_true')
+    parser.add_argument(
+        '--tolerance', type=float, default=1.5,
+        help='slowdown ratio against the baseline counted as a regression'
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.names, args.sizes, args.repeat)
+    regressions = []
+    if args.compare:
+        baseline = json.loads(BASELINE.read_text())
+        regressions = compare(report, baseline, args.tolerance)
+        report['regressions'] = regressions
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+    if args.save_baseline:
+        BASELINE.write_text(output)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,43 @@
 __version__ = '0.1.8'
 
-from pinyin_rhymer.data.pinyin_list import PINYIN_LIST, PINYIN_ZI_DICT
+from pinyin_rhymer.data import pinyin_list
 from pinyin_rhymer.pinyin import PinYin
 
 
-def rhyme_with(source, consonants, vowels, tones):
-    pinyin = PinYin(source)
-    return pinyin.generate_rhymes(consonants, vowels, tones)
+def __getattr__(name):
+    if name in (
+        'PINYIN_LIST', 'PINYIN_ZI_DICT', 'PINYIN_ZI_INDEX', 'ZI_PINYIN_INDEX'
+    ):
+        return getattr(pinyin_list, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def rhyme_with(source, consonants, vowels, tones, model=None):
+    pinyin = PinYin.intern(source)
+    return pinyin.generate_rhymes(consonants, vowels, tones, model)
+
+
+def generate_rhymes_batch(sources, consonants, vowels, tones, model=None):
+    """
+    Generate the rhymes of many sources at once, as a dict of tuples keyed by
+    source. Sources sharing a consonant family, vowel and tone share their
+    scheme resolution, and identical resolutions share their candidates.
+    """
+    resolved = {}
+    generated = {}
+    results = {}
+    for source in sources:
+        if source in results:
+            continue
+        pinyin = PinYin.intern(source)
+        key = (pinyin.consonant.family, pinyin.vowel, pinyin.tone)
+        schemes = resolved.get(key)
+        if schemes is None:
+            schemes = pinyin._resolve(consonants, vowels, tones, model)
+            resolved[key] = schemes
+        rhymes = generated.get(schemes)
+        if rhymes is None:
+            rhymes = tuple(PinYin._generate(*schemes))
+            generated[schemes] = rhymes
+        results[source] = rhymes
+    return results
@@ -0,0 +1,5 @@
+import sys
+
+from pinyin_rhymer.cli import main
+
+sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Command-line interface of `rhyme_with`.
+
+    pinyin-rhymer ai4 shuang1 -v FOURTEEN_RHYMES -t ALL
+    cut -f1 words.txt | pinyin-rhymer --format json > rhymes.jsonl
+
+Without queries, or with `-`, newline-delimited queries are read from stdin
+and answered one line at a time, so a single process serves a whole
+pipeline.
+"""
+import argparse
+import json
+import sys
+from functools import lru_cache
+
+from pinyin_rhymer.error import PARSE_ERRORS, NotARhymeSchemeError
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.rhyme_scheme import parse_tones
+
+CACHE_SIZE = 4096
+
+
+def _tones(value):
+    try:
+        return parse_tones(value)
+    except NotARhymeSchemeError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='pinyin-rhymer', description='Generate pinyin rhymes.'
+    )
+    parser.add_argument(
+        'queries', nargs='*',
+        help='pinyin syllables to rhyme, or - to read them from stdin'
+    )
+    parser.add_argument(
+        '-c', '--consonants', default='ALL',
+        help='ALL, FAMILY, or consonants such as bpmf (default: ALL)'
+    )
+    parser.add_argument(
+        '-v', '--vowels', default='SIMILAR_SOUNDING',
+        help='a VowelScheme or comma separated vowels '
+        '(default: SIMILAR_SOUNDING)'
+    )
+    parser.add_argument(
+        '-t', '--tones', type=_tones, default=None,
+        help='ALL or tone numbers such as 14 or 1,4 '
+        '(default: the same tone)'
+    )
+    parser.add_argument(
+        '--top', type=int, default=None,
+        help='only the best ranked rhymes, by distance and frequency'
+    )
+    parser.add_argument(
+        '--tone-marks', action='store_true',
+        help='print rhymes with tone marks instead of numbers'
+    )
+    parser.add_argument(
+        '--format', choices=('text', 'json'), default='text',
+        help='tab separated text or JSON lines (default: text)'
+    )
+    return parser
+
+
+def _queries(args, stdin):
+    if not args.queries or args.queries == ['-']:
+        for line in stdin:
+            query = line.strip()
+            if query:
+                yield query
+    else:
+        yield from args.queries
+
+
+def _rhymer(args):
+    @lru_cache(maxsize=CACHE_SIZE)
+    def rhyme(query):
+        pinyin = PinYin.intern(query)
+        if args.top is None:
+            rhymes = pinyin.generate_rhymes(
+                args.consonants, args.vowels, args.tones
+            )
+        else:
+            rhymes = pinyin.rank_rhymes(
+                args.consonants, args.vowels, args.tones, top=args.top
+            )
+        spell = PinYin.with_tone_mark if args.tone_marks else PinYin.__str__
+        return tuple(map(spell, rhymes))
+    return rhyme
+
+
+def _format(args, query, rhymes, error):
+    if args.format == 'json':
+        record = {'query': query}
+        if error is None:
+            record['rhymes'] = list(rhymes)
+        else:
+            record['error'] = error
+        return json.dumps(record, ensure_ascii=False)
+    if error is None:
+        return f'{query}\t{" ".join(rhymes)}'
+    return f'{query}\terror: {error}'
+
+
+def main(argv=None, stdin=None, stdout=None):
+    args = build_parser().parse_args(argv)
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    rhyme = _rhymer(args)
+    failed = False
+    for query in _queries(args, stdin):
+        rhymes, error = (), None
+        try:
+            rhymes = rhyme(query)
+        except PARSE_ERRORS + (NotARhymeSchemeError, ValueError) as e:
+            error = str(e)
+            failed = True
+        print(_format(args, query, rhymes, error), file=stdout)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+from pinyin_rhymer.consonant import Consonant
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.vowel import Vowel
+
+TONE_BITS = 4
+VOWEL_BITS = 6
+_TONE_MASK = (1 << TONE_BITS) - 1
+_VOWEL_MASK = (1 << VOWEL_BITS) - 1
+_VOWEL_SHIFT = TONE_BITS
+_CONSONANT_SHIFT = TONE_BITS + VOWEL_BITS
+_CONSONANTS = {x._value_: x for x in Consonant}
+_VOWELS = {x._value_: x for x in Vowel}
+
+
+def encode(consonant, vowel, tone):
+    """
+    Pack a consonant, vowel and tone into one int using their enum ordinals.
+    """
+    return (
+        consonant._value_ << _CONSONANT_SHIFT |
+        vowel._value_ << _VOWEL_SHIFT |
+        tone
+    )
+
+
+class CompactPinYin(int):
+    """
+    A syllable stored as a single int, hashed and compared as that int.
+
+    Accepts the same arguments as PinYin, a PinYin, or an already encoded int.
+    """
+    __slots__ = ()
+
+    def __new__(cls, in_str, vowel=None, tone=1):
+        if isinstance(in_str, int):
+            return super().__new__(cls, in_str)
+        if not isinstance(in_str, PinYin):
+            in_str = PinYin.intern(in_str, vowel, tone)
+        return super().__new__(
+            cls, encode(in_str.consonant, in_str.vowel, in_str.tone)
+        )
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}("{str(self)}")'
+
+    def __str__(self):
+        return str(self.to_pinyin())
+
+    @property
+    def consonant(self):
+        return _CONSONANTS[self >> _CONSONANT_SHIFT]
+
+    @property
+    def vowel(self):
+        return _VOWELS[self >> _VOWEL_SHIFT & _VOWEL_MASK]
+
+    @property
+    def tone(self):
+        return self & _TONE_MASK
+
+    def to_pinyin(self):
+        return PinYin.intern(self.consonant, self.vowel, self.tone)
+
+    def with_tone_mark(self):
+        return self.to_pinyin().with_tone_mark()
@@ -1,7 +1,11 @@
 from enum import Enum, auto
+from functools import lru_cache
 
 from pinyin_rhymer.error import NotAConsonantError
 
+# Capitals stand for the retroflex consonants, as in 'ZCS' for zh, ch and sh.
+CONSONANT_SHORTHANDS = {'Z': 'zh', 'C': 'ch', 'S': 'sh'}
+
 
 class ConsonantFamily(Enum):
     Plosives = auto()
@@ -64,22 +68,20 @@ class Consonant(Enum):
 
     @classmethod
     def _missing_(cls, name):
-        if isinstance(name, cls):
-            return name
-        if not name:
-            return Consonant.Empty
-        try:
-            return getattr(cls, name)
-        except AttributeError:
-            pass
-
-        try:
-            translated = (
-                name.replace('Z', 'zh').replace('C', 'ch').replace('S', 'sh')
-            )
-            return cls[translated]
-        except KeyError:
+        consonant = cls.lookup(name)
+        if consonant is None:
             raise NotAConsonantError(name)
+        return consonant
+
+    @classmethod
+    def lookup(cls, name, default=None):
+        """
+        Consonant of a name, shorthand or value, or `default`, without
+        raising.
+        """
+        if name.__hash__ is None:
+            return default
+        return CONSONANT_LOOKUP.get(name, default)
 
     @classmethod
     def all(cls):
@@ -93,3 +95,37 @@ class Consonant(Enum):
         return {
             x for x in self.__class__ if x.family == self.family
         }
+
+
+CONSONANT_LOOKUP = {None: Consonant.Empty, '': Consonant.Empty}
+for _consonant in Consonant:
+    CONSONANT_LOOKUP[_consonant] = _consonant
+    CONSONANT_LOOKUP[_consonant.name] = _consonant
+    CONSONANT_LOOKUP[_consonant._value_] = _consonant
+for (_shorthand, _name) in CONSONANT_SHORTHANDS.items():
+    CONSONANT_LOOKUP[_shorthand] = Consonant[_name]
+
+
+def consonant_mask(consonants):
+    """
+    Bitmask of consonants, bit `consonant._value_` standing for each one.
+    """
+    mask = 0
+    for consonant in consonants:
+        mask |= 1 << consonant._value_
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def consonants_of(mask):
+    """
+    Consonants of a bitmask, in definition order.
+    """
+    return tuple(x for x in Consonant if mask >> x._value_ & 1)
+
+
+ALL_CONSONANTS = consonant_mask(Consonant)
+FAMILY_MASKS = {
+    family: consonant_mask(x for x in Consonant if x.family is family)
+    for family in ConsonantFamily
+}
@@ -0,0 +1,232 @@
+"""
+Compiled, memory-mapped syllable table.
+
+The file holds every syllable with its character count and characters, and
+the readings of every character, in native byte order:
+
+    header        magic, version, signature, syllable count, character count
+    key offsets   uint32 per syllable + 1, into the pool
+    zi offsets    uint32 per syllable + 1, into the pool
+    counts        uint32 per syllable
+    order         uint32 per syllable, sorted by utf-8 spelling
+    characters    uint32 code point per character, sorted
+    starts        uint32 per character + 1, into readings
+    readings      uint32 syllable positions, grouped by character
+    pool          utf-8 syllables, then utf-8 characters
+
+Opened with `mmap`, processes forked from the same server share its pages,
+and strings are only decoded when they are read.
+"""
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+
+MAGIC = b'PYDB'
+VERSION = 2
+HEADER = struct.Struct('=4sIIII')
+
+
+def compile_rows(rows, signature=0):
+    """
+    Bytes of a database holding (syllable, count, characters) rows.
+    """
+    rows = list(rows)
+    keys = [x[0].encode('utf-8') for x in rows]
+    zis = [x[2].encode('utf-8') for x in rows]
+    key_offsets = array('I', [0])
+    for each in keys:
+        key_offsets.append(key_offsets[-1] + len(each))
+    zi_offsets = array('I', [key_offsets[-1]])
+    for each in zis:
+        zi_offsets.append(zi_offsets[-1] + len(each))
+    counts = array('I', (int(x[1]) for x in rows))
+    order = array('I', sorted(range(len(rows)), key=keys.__getitem__))
+    by_zi = {}
+    for (i, row) in enumerate(rows):
+        for zi in row[2]:
+            by_zi.setdefault(ord(zi), []).append(i)
+    characters = array('I', sorted(by_zi))
+    starts = array('I', [0])
+    readings = array('I')
+    for each in characters:
+        readings.extend(by_zi[each])
+        starts.append(len(readings))
+    return b''.join((
+        HEADER.pack(MAGIC, VERSION, signature, len(rows), len(characters)),
+        key_offsets.tobytes(),
+        zi_offsets.tobytes(),
+        counts.tobytes(),
+        order.tobytes(),
+        characters.tobytes(),
+        starts.tobytes(),
+        readings.tobytes(),
+        *keys,
+        *zis,
+    ))
+
+
+class SyllableDatabase(Mapping):
+    """
+    Read-only mapping of tone-marked syllable to its characters, over a
+    compiled buffer. `characters` and `readings` serve both directions as
+    tuples decoded on demand.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < HEADER.size:
+            raise ValueError('Not a compiled syllable database.')
+        magic, version, self.signature, size, zi_size = HEADER.unpack_from(
+            view
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Not a compiled syllable database.')
+        position = HEADER.size
+        parts = []
+        for count in (size + 1, size + 1, size, size, zi_size, zi_size + 1):
+            end = position + count * 4
+            parts.append(view[position:end].cast('I'))
+            position = end
+        (
+            self._key_offsets, self._zi_offsets, self._counts, self._order,
+            self._characters, self._starts
+        ) = parts
+        end = position + self._starts[-1] * 4
+        self._readings = view[position:end].cast('I')
+        self._pool = view[end:]
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_rows(cls, rows, signature=0):
+        return cls(compile_rows(rows, signature))
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __iter__(self):
+        return map(self.syllable, range(len(self)))
+
+    def __contains__(self, syllable):
+        return isinstance(syllable, str) and self.find(syllable) >= 0
+
+    def __getitem__(self, syllable):
+        i = self.find(syllable)
+        if i < 0:
+            raise KeyError(syllable)
+        return self.zi(i)
+
+    def find(self, syllable):
+        """
+        Position of a syllable in the table, or -1.
+        """
+        key = syllable.encode('utf-8')
+        i = bisect_left(self._order, key, key=self._key_bytes)
+        if i < len(self) and self._key_bytes(self._order[i]) == key:
+            return self._order[i]
+        return -1
+
+    def _key_bytes(self, i):
+        return bytes(self._key_view(i))
+
+    def _key_view(self, i):
+        return self._pool[self._key_offsets[i]:self._key_offsets[i + 1]]
+
+    def syllable(self, i):
+        return str(self._key_view(i), 'utf-8')
+
+    def zi_view(self, i):
+        """
+        Undecoded utf-8 characters of the syllable at position `i`.
+        """
+        return self._pool[self._zi_offsets[i]:self._zi_offsets[i + 1]]
+
+    def zi(self, i):
+        return str(self.zi_view(i), 'utf-8')
+
+    def characters(self, syllable):
+        """
+        Tuple of the characters read as a syllable, empty if not listed.
+        """
+        i = self.find(syllable)
+        return tuple(self.zi(i)) if i >= 0 else ()
+
+    def readings(self, zi):
+        """
+        Tuple of the syllables a character reads as, in table order.
+        """
+        code = ord(zi) if len(zi) == 1 else -1
+        i = bisect_left(self._characters, code)
+        if i == len(self._characters) or self._characters[i] != code:
+            return ()
+        return tuple(
+            self.syllable(x)
+            for x in self._readings[self._starts[i]:self._starts[i + 1]]
+        )
+
+    def iter_characters(self):
+        """
+        Yield every character with readings, by code point.
+        """
+        return map(chr, self._characters)
+
+    def count(self, syllable):
+        i = self.find(syllable)
+        if i < 0:
+            raise KeyError(syllable)
+        return self._counts[i]
+
+    def counts(self):
+        """
+        Yield every (syllable, count) pair in table order.
+        """
+        for i in range(len(self)):
+            yield self.syllable(i), self._counts[i]
+
+
+class CharacterIndex(Mapping):
+    """
+    Read-only mapping of syllable to the tuple of its characters.
+    """
+
+    def __init__(self, database):
+        self._database = database
+
+    def __len__(self):
+        return len(self._database)
+
+    def __iter__(self):
+        return iter(self._database)
+
+    def __getitem__(self, syllable):
+        characters = self._database.characters(syllable)
+        if not characters and syllable not in self._database:
+            raise KeyError(syllable)
+        return characters
+
+
+class ReadingIndex(Mapping):
+    """
+    Read-only mapping of character to the tuple of its readings.
+    """
+
+    def __init__(self, database):
+        self._database = database
+
+    def __len__(self):
+        return len(self._database._characters)
+
+    def __iter__(self):
+        return self._database.iter_characters()
+
+    def __getitem__(self, zi):
+        readings = self._database.readings(zi)
+        if not readings:
+            raise KeyError(zi)
+        return readings
@@ -1,10 +1,88 @@
+"""
+Syllable to character data from `pinyin_list.csv`.
+
+`PINYIN_ZI_DICT` and `PINYIN_LIST` are loaded on first access, from the
+memory-mapped `pinyin_list.bin` when it was compiled from a CSV with the same
+CRC-32, otherwise compiled in memory from the CSV itself. Run this module to
+recompile the binary after editing the CSV. `PINYIN_ZI_DICT` is a read-only
+SyllableDatabase, which also serves the character count of each syllable.
+
+`PINYIN_ZI_INDEX` maps each syllable to a tuple of its characters, and
+`ZI_PINYIN_INDEX` maps each character to a tuple of its readings in CSV
+order. Both are read-only views of `PINYIN_ZI_DICT`, decoding entries as they
+are looked up, so worker processes share the mapped pages instead of each
+building dicts.
+"""
 import csv
+import zlib
 from pathlib import Path
 
+from pinyin_rhymer.data.database import (
+    CharacterIndex, ReadingIndex, SyllableDatabase, compile_rows
+)
+
 pinyin_file = Path(__file__).parent / 'pinyin_list.csv'
+compiled_file = Path(__file__).parent / 'pinyin_list.bin'
+
+_database = None
+_indexes = None
+
+
+def read_csv():
+    with open(pinyin_file, 'r', encoding='utf-8') as csv_file:
+        reader = csv.DictReader(csv_file)
+        return [(x['pinyin'], int(x['count']), x['zi']) for x in reader]
+
+
+def _source_signature():
+    return zlib.crc32(pinyin_file.read_bytes())
+
+
+def compile_data():
+    data = compile_rows(read_csv(), _source_signature())
+    compiled_file.write_bytes(data)
+
+
+def _open_compiled():
+    try:
+        database = SyllableDatabase.open(compiled_file)
+    except (OSError, ValueError):
+        return None
+    if database.signature != _source_signature():
+        return None
+    return database
+
+
+def load():
+    global _database
+    if _database is None:
+        database = _open_compiled()
+        if database is None:
+            database = SyllableDatabase.from_rows(read_csv())
+        _database = database
+    return _database
+
+
+def load_indexes():
+    global _indexes
+    if _indexes is None:
+        database = load()
+        _indexes = (CharacterIndex(database), ReadingIndex(database))
+    return _indexes
+
+
+def __getattr__(name):
+    match name:
+        case 'PINYIN_ZI_DICT':
+            return load()
+        case 'PINYIN_LIST':
+            return load().keys()
+        case 'PINYIN_ZI_INDEX':
+            return load_indexes()[0]
+        case 'ZI_PINYIN_INDEX':
+            return load_indexes()[1]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
-csv_file = open(pinyin_file, 'r', encoding='utf-8')
-reader = csv.DictReader(csv_file)
-PINYIN_ZI_DICT = {x['pinyin']: x['zi'] for x in reader}
-PINYIN_LIST = PINYIN_ZI_DICT.keys()
-csv_file.close()
+if __name__ == '__main__':
+    compile_data()
@@ -26,3 +26,8 @@ class NotARhymeSchemeError(Exception):
     def __init__(self, string, scheme_name):
         message = f'"{string}" is not a valid {scheme_name}.'
         super().__init__(message)
+
+
+PARSE_ERRORS = (
+    IrregularPinYinError, NotAPinYinError, NotAConsonantError, NotAVowelError
+)
@@ -0,0 +1,128 @@
+"""
+Conversion of Chinese characters to pinyin, to query rhymes from hanzi.
+
+    >>> convert('我爱你')
+    [PinYin("wo3"), PinYin("ai4"), PinYin("ni3")]
+    >>> convert('快乐', all_readings=True)
+    [(PinYin("kuai4"),), (PinYin("le4"), PinYin("yue4"), PinYin("yao4"), ...)]
+
+A polyphone reads by default as its reading in `DEFAULT_READINGS`, which
+lists the usual reading of common polyphones such as 的, 了 and 着. Other
+polyphones read as the syllable with the highest character count in
+`pinyin_list.csv`, ties going to the CSV order. Either way conversion is
+deterministic but context-free. Characters without a regular reading, such
+as punctuation, are skipped.
+"""
+from pinyin_rhymer.data import pinyin_list
+from pinyin_rhymer.error import PARSE_ERRORS
+from pinyin_rhymer.pinyin import PinYin
+
+# The character count of a syllable says nothing about how often each of
+# its characters is read that way, so it picks the wrong default for these.
+DEFAULT_READINGS = {
+    '的': 'de5', '了': 'le5', '着': 'zhe5', '还': 'hai2', '地': 'de5',
+    '乐': 'le4', '得': 'de5', '说': 'shuo1', '没': 'mei2', '只': 'zhi3',
+    '种': 'zhong3', '少': 'shao3', '好': 'hao3', '大': 'da4', '过': 'guo4',
+    '当': 'dang1', '给': 'gei3', '么': 'me5', '吗': 'ma5', '呢': 'ne5',
+    '吧': 'ba5', '啊': 'a5', '个': 'ge4', '角': 'jiao3', '将': 'jiang1',
+    '传': 'chuan2', '调': 'diao4', '参': 'can1', '似': 'si4', '弹': 'tan2',
+    '朝': 'chao2', '教': 'jiao4', '干': 'gan4', '壳': 'ke2', '藏': 'cang2',
+    '担': 'dan1', '否': 'fou3', '几': 'ji3', '间': 'jian1', '解': 'jie3',
+    '累': 'lei4', '量': 'liang4', '绿': 'lv4', '曲': 'qu3', '圈': 'quan1',
+    '强': 'qiang2', '散': 'san4', '舍': 'she3', '什': 'shen2', '盛': 'sheng4',
+    '识': 'shi2', '吓': 'xia4', '校': 'xiao4', '旋': 'xuan2', '压': 'ya1',
+    '正': 'zheng4', '症': 'zheng4', '转': 'zhuan3', '佛': 'fo2', '奇': 'qi2',
+    '查': 'cha2', '单': 'dan1', '车': 'che1',
+}
+
+
+class HanziIndex(object):
+    """
+    Readings of characters as interned PinYin, default first.
+
+    The readings of a character are read from `PINYIN_ZI_DICT` the first
+    time it is looked up, and kept for the characters actually seen, so a
+    process never holds a table of every character.
+    """
+
+    def __init__(self):
+        self._parsed = {}
+        self._readings = {}
+
+    def readings(self, zi):
+        readings = self._readings.get(zi)
+        if readings is None:
+            readings = self._readings[zi] = self._lookup(zi)
+        return readings
+
+    def _lookup(self, zi):
+        database = pinyin_list.PINYIN_ZI_DICT
+        regular = [
+            x for x in database.readings(zi) if self._parse(x) is not None
+        ]
+        regular.sort(key=database.count, reverse=True)
+        readings = tuple(self._parsed[x] for x in regular)
+        default = DEFAULT_READINGS.get(zi)
+        if default is not None:
+            default = PinYin.intern(default)
+            if default in readings:
+                readings = (default,) + tuple(
+                    x for x in readings if x is not default
+                )
+        return readings
+
+    def _parse(self, syllable):
+        if syllable not in self._parsed:
+            try:
+                self._parsed[syllable] = PinYin.intern(syllable)
+            except PARSE_ERRORS:
+                self._parsed[syllable] = None
+        return self._parsed[syllable]
+
+    def convert(self, text, all_readings=False):
+        return list(self.iter_convert([text], all_readings))
+
+    def iter_convert(self, chunks, all_readings=False):
+        """
+        Yield the PinYin of every character of a text split in chunks, or the
+        tuple of all its readings with `all_readings`.
+        """
+        for chunk in chunks:
+            for zi in chunk:
+                readings = self.readings(zi)
+                if readings:
+                    yield readings if all_readings else readings[0]
+
+
+HANZI_INDEX = HanziIndex()
+
+
+def readings(zi):
+    return HANZI_INDEX.readings(zi)
+
+
+def convert(text, all_readings=False):
+    return HANZI_INDEX.convert(text, all_readings)
+
+
+def line_ending(text):
+    """
+    The default reading of the last character of a line, or None, to rhyme
+    with a lyric line directly.
+    """
+    for zi in reversed(text):
+        zi_readings = HANZI_INDEX.readings(zi)
+        if zi_readings:
+            return zi_readings[0]
+    return None
+
+
+def convert_batch(texts, all_readings=False):
+    """
+    PinYin of many texts at once, as a dict of lists keyed by text.
+    """
+    return {x: HANZI_INDEX.convert(x, all_readings) for x in texts}
+
+
+def iter_convert(chunks, all_readings=False):
+    return HANZI_INDEX.iter_convert(chunks, all_readings)
@@ -0,0 +1,199 @@
+"""
+On-disk rhyme index of a corpus, bucketing entries by their last syllable.
+
+Entries are usually lines of lyrics. Each one is filed under the
+CompactPinYin code of its last pinyin syllable, which is the finest rhyme
+class of every VowelScheme and ConsonantScheme. A query resolves its schemes
+once into the codes that rhyme with the source and reads those buckets, so
+one index serves every scheme.
+
+Building shards the parsing across a process pool. The index file uses native
+byte order and is memory-mapped when opened, so concurrent readers share its
+pages:
+
+    header     magic, version, entry count, bucket count
+    codes      uint32 per bucket, sorted
+    starts     uint32 per bucket + 1, into postings
+    postings   uint32 entry ids, grouped by bucket
+    offsets    uint64 per entry + 1, into the string pool
+    pool       utf-8 entries
+"""
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+from pinyin_rhymer.compact import encode
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.rhyme_scheme import VowelScheme
+from pinyin_rhymer.stream import annotate, iter_tokens
+
+MAGIC = b'PYRI'
+VERSION = 1
+HEADER = struct.Struct('=4sIII')
+SHARD_SIZE = 10_000
+
+
+def line_ending(line):
+    """
+    The last syllable of a line that parses as a pinyin, or None.
+
+    Tokens are parsed from the end of the line, stopping at the first one
+    that holds a pinyin, and a joined word counts by its last syllable.
+    """
+    for token in reversed(list(iter_tokens([line]))):
+        for record in reversed(list(annotate([token]))):
+            if record.pinyin is not None:
+                return record.pinyin
+    return None
+
+
+def _bucket_shard(shard):
+    start, lines = shard
+    codes = []
+    for (i, line) in enumerate(lines, start):
+        pinyin = line_ending(line)
+        if pinyin is not None:
+            code = encode(pinyin.consonant, pinyin.vowel, pinyin.tone)
+            codes.append((code, i))
+    return codes
+
+
+def _shards(entries, size):
+    for start in range(0, len(entries), size):
+        yield start, entries[start:start + size]
+
+
+def build_index(entries, path, processes=None, shard_size=SHARD_SIZE):
+    """
+    Bucket `entries` by their line ending and write the index to `path`.
+
+    With `processes` of 1 the work stays in this process, otherwise it is
+    sharded across a pool of that many workers, or one per CPU if None.
+    """
+    entries = list(entries)
+    shards = _shards(entries, shard_size)
+    if processes == 1:
+        results = map(_bucket_shard, shards)
+    else:
+        executor = ProcessPoolExecutor(processes)
+        results = executor.map(_bucket_shard, shards)
+    buckets = {}
+    try:
+        for codes in results:
+            for (code, i) in codes:
+                buckets.setdefault(code, array('I')).append(i)
+    finally:
+        if processes != 1:
+            executor.shutdown()
+    _write(path, entries, buckets)
+
+
+def _write(path, entries, buckets):
+    codes = array('I', sorted(buckets))
+    starts = array('I', [0])
+    postings = array('I')
+    for code in codes:
+        postings.extend(buckets[code])
+        starts.append(len(postings))
+    encoded = [x.encode('utf-8') for x in entries]
+    offsets = array('Q', [0])
+    for each in encoded:
+        offsets.append(offsets[-1] + len(each))
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(entries), len(codes)))
+        for part in (codes, starts, postings):
+            part.tofile(f)
+        f.write(b'\0' * (-f.tell() % 8))
+        offsets.tofile(f)
+        for each in encoded:
+            f.write(each)
+
+
+class RhymeIndex(object):
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, entries, buckets = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'"{path}" is not a rhyme index.')
+        position = HEADER.size
+        self._codes, position = self._cast(view, position, 'I', buckets)
+        self._starts, position = self._cast(view, position, 'I', buckets + 1)
+        self._postings, position = self._cast(
+            view, position, 'I', self._starts[-1]
+        )
+        position += -position % 8
+        self._offsets, position = self._cast(view, position, 'Q', entries + 1)
+        self._pool = view[position:]
+
+    @staticmethod
+    def _cast(view, position, fmt, count):
+        end = position + count * struct.calcsize(fmt)
+        return view[position:end].cast(fmt), end
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return str(self._pool[start:end], 'utf-8')
+
+    def close(self):
+        for view in (
+            self._codes, self._starts, self._postings, self._offsets,
+            self._pool
+        ):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def bucket(self, code):
+        """
+        Entry ids filed under a CompactPinYin code.
+        """
+        i = bisect_left(self._codes, code)
+        if i == len(self._codes) or self._codes[i] != code:
+            return self._postings[0:0]
+        return self._postings[self._starts[i]:self._starts[i + 1]]
+
+    def rhyme_ids(
+        self,
+        source,
+        consonants='ALL',
+        vowels=VowelScheme.SIMILAR_SOUNDING,
+        tones=None
+    ):
+        consonants, vowels, tones = PinYin.intern(source)._resolve(
+            consonants, vowels, tones
+        )
+        codes = dict.fromkeys(
+            encode(consonant, vowel, tone)
+            for consonant in consonants
+            for vowel in vowels
+            for tone in tones
+        )
+        for code in codes:
+            yield from self.bucket(code)
+
+    def rhymes(
+        self,
+        source,
+        consonants='ALL',
+        vowels=VowelScheme.SIMILAR_SOUNDING,
+        tones=None
+    ):
+        """
+        Yield every entry whose line ending rhymes with `source`.
+        """
+        for i in self.rhyme_ids(source, consonants, vowels, tones):
+            yield self[i]
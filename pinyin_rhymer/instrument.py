@@ -0,0 +1,213 @@
+"""
+Opt-in instrumentation of the hot paths.
+
+    from pinyin_rhymer import instrument
+    instrument.enable(hook=None)
+    ...
+    instrument.report()
+
+`enable` wraps `PinYin._parse`, `PinYin.is_valid`, `Vowel.rhyme`, the
+scheme resolution of `PinYin._vowel_mask` and the candidate loop of every
+rhyme generation to count their calls and time, and counts the rows and
+classes read from every RhymeTable. `disable` puts the originals back.
+Nothing is wrapped while disabled, so the hot paths then run at full speed.
+`hook`, if given, is called with the name and duration of every timed call,
+to feed another metrics system.
+"""
+import time
+from functools import wraps
+
+from pinyin_rhymer.pinyin import _INTERNED, PARSE_CACHE, PinYin
+from pinyin_rhymer.rhyme_scheme import VowelScheme
+from pinyin_rhymer.vowel import RhymeTable, Vowel
+
+
+def _rate(hits, misses):
+    total = hits + misses
+    return hits / total if total else 0.0
+
+
+class Instrumentation(object):
+    def __init__(self):
+        self.hook = None
+        self._originals = {}
+        self.reset()
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def reset(self):
+        self.timings = {}
+        self.candidates_tried = 0
+        self.candidates_yielded = 0
+        self.table_lookups = 0
+        self.table_builds = 0
+
+    def record(self, name, seconds):
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = [0, 0.0]
+        timing[0] += 1
+        timing[1] += seconds
+        if self.hook is not None:
+            self.hook(name, seconds)
+
+    def enable(self, hook=None):
+        self.hook = hook
+        if self.enabled:
+            return
+        self._patch(PinYin, '_parse', self._timed('parse', PinYin._parse))
+        is_valid = PinYin.__dict__['is_valid']
+        self._patch(
+            PinYin, 'is_valid',
+            property(self._timed('is_valid', is_valid.fget))
+        )
+        self._patch(Vowel, 'rhyme', self._timed_rhyme(Vowel.rhyme))
+        self._patch(
+            PinYin, '_vowel_mask', self._timed_vowel_mask(PinYin._vowel_mask)
+        )
+        self._patch(
+            PinYin, '_generate',
+            staticmethod(self._counted_generate(PinYin._generate))
+        )
+        self._patch(
+            RhymeTable, 'lookup',
+            self._counted('table_lookups', RhymeTable.lookup)
+        )
+        self._patch(
+            RhymeTable, 'classes',
+            self._counted('table_lookups', RhymeTable.classes)
+        )
+        self._patch(
+            RhymeTable, '_build_row',
+            self._counted('table_builds', RhymeTable._build_row)
+        )
+
+    def disable(self):
+        for ((owner, name), original) in self._originals.items():
+            setattr(owner, name, original)
+        self._originals.clear()
+        self.hook = None
+
+    def _patch(self, owner, name, wrapper):
+        self._originals[(owner, name)] = owner.__dict__[name]
+        setattr(owner, name, wrapper)
+
+    def _timed(self, name, func):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return timed
+
+    def _timed_rhyme(self, func):
+        @wraps(func)
+        def rhyme(vowel, rhymescheme, *args, **kwargs):
+            scheme = VowelScheme.lookup(rhymescheme)
+            name = f'rhyme.{scheme.name if scheme else rhymescheme}'
+            start = time.perf_counter()
+            try:
+                return func(vowel, rhymescheme, *args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return rhyme
+
+    def _timed_vowel_mask(self, func):
+        @wraps(func)
+        def vowel_mask(pinyin, vowels, *args, **kwargs):
+            scheme = VowelScheme.lookup(vowels)
+            if scheme is None:
+                return func(pinyin, vowels, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(pinyin, vowels, *args, **kwargs)
+            finally:
+                self.record(
+                    f'rhyme.{scheme.name}', time.perf_counter() - start
+                )
+        return vowel_mask
+
+    def _counted(self, counter, func):
+        @wraps(func)
+        def counted(*args, **kwargs):
+            setattr(self, counter, getattr(self, counter) + 1)
+            return func(*args, **kwargs)
+        return counted
+
+    def _counted_generate(self, func):
+        @wraps(func)
+        def generate(consonants, vowels, tones):
+            self.candidates_tried += (
+                len(consonants) * len(vowels) * len(tones)
+            )
+            candidates = func(consonants, vowels, tones)
+            elapsed = 0.0
+            try:
+                while True:
+                    start = time.perf_counter()
+                    pinyin = next(candidates, None)
+                    elapsed += time.perf_counter() - start
+                    if pinyin is None:
+                        return
+                    self.candidates_yielded += 1
+                    yield pinyin
+            finally:
+                self.record('generate_rhymes', elapsed)
+        return generate
+
+    def report(self):
+        """
+        Calls, time and cache statistics gathered so far, as a dict.
+        """
+        table_misses = self.table_builds
+        table_hits = self.table_lookups - table_misses
+        return {
+            'enabled': self.enabled,
+            'timings': {
+                name: {
+                    'calls': calls,
+                    'seconds': seconds,
+                    'mean': seconds / calls,
+                } for (name, (calls, seconds)) in self.timings.items()
+            },
+            'candidates': {
+                'tried': self.candidates_tried,
+                'yielded': self.candidates_yielded,
+            },
+            'caches': {
+                'parse': {
+                    'hits': PARSE_CACHE.hits,
+                    'misses': PARSE_CACHE.misses,
+                    'hit_rate': _rate(PARSE_CACHE.hits, PARSE_CACHE.misses),
+                    'interned': len(_INTERNED),
+                },
+                'rhyme_table': {
+                    'hits': table_hits,
+                    'misses': table_misses,
+                    'hit_rate': _rate(table_hits, table_misses),
+                },
+            },
+        }
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def enable(hook=None):
+    INSTRUMENTATION.enable(hook)
+
+
+def disable():
+    INSTRUMENTATION.disable()
+
+
+def reset():
+    INSTRUMENTATION.reset()
+
+
+def report():
+    return INSTRUMENTATION.report()
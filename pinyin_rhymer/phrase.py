@@ -0,0 +1,166 @@
+import itertools
+from collections import namedtuple
+
+from pinyin_rhymer.consonant import consonant_mask
+from pinyin_rhymer.error import PARSE_ERRORS
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.rhyme_scheme import VowelScheme
+from pinyin_rhymer.vowel import vowel_mask
+
+
+class RhymeScheme(namedtuple(
+    'RhymeScheme', ('consonants', 'vowels', 'tones'),
+    defaults=('ALL', VowelScheme.SIMILAR_SOUNDING, None)
+)):
+    """
+    Consonant, vowel and tone schemes of one syllable position. Lists and
+    sets of members are stored as tuples, so a scheme is always hashable.
+    """
+    __slots__ = ()
+
+    def __new__(cls, consonants='ALL',
+                vowels=VowelScheme.SIMILAR_SOUNDING, tones=None):
+        return super().__new__(
+            cls, _freeze(consonants), _freeze(vowels), _freeze(tones)
+        )
+
+
+def _freeze(field):
+    if isinstance(field, (list, set, frozenset)):
+        return tuple(field)
+    return field
+
+
+class Phrase(object):
+    """
+    A word or line of syllables rhyming on its trailing syllables, 双押 for
+    two of them, 三押 for three.
+
+    `schemes` is either one RhymeScheme used for the last `length` syllables,
+    or a sequence of RhymeScheme, one per trailing syllable.
+    """
+
+    def __init__(self, syllables):
+        if isinstance(syllables, Phrase):
+            syllables = syllables.syllables
+        elif isinstance(syllables, str):
+            syllables = syllables.split()
+        self.syllables = tuple(
+            x if isinstance(x, PinYin) else PinYin.intern(x)
+            for x in syllables
+        )
+        self._resolved = {}
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}("{str(self)}")'
+
+    def __str__(self):
+        return ' '.join(map(str, self.syllables))
+
+    def __len__(self):
+        return len(self.syllables)
+
+    def __iter__(self):
+        return iter(self.syllables)
+
+    def __getitem__(self, index):
+        return self.syllables[index]
+
+    def __hash__(self):
+        return hash(self.syllables)
+
+    def __eq__(self, other):
+        if not isinstance(other, (Phrase, str, list, tuple)):
+            return NotImplemented
+        if not isinstance(other, Phrase):
+            try:
+                other = Phrase(other)
+            except PARSE_ERRORS:
+                return False
+        return self.syllables == other.syllables
+
+    def rhymes_with(self, other, schemes=RhymeScheme(), length=None):
+        other = Phrase(other)
+        positions = self._membership(self._positions(schemes, length))
+        if len(other) < len(positions):
+            return False
+        return self._matches(other.syllables, positions)
+
+    def find_rhymes(self, phrases, schemes=RhymeScheme(), length=None):
+        """
+        Yield the phrases of an iterable rhyming with this one, checking the
+        last syllable first so most candidates are rejected after one test.
+        """
+        positions = self._membership(self._positions(schemes, length))
+        for phrase in phrases:
+            phrase = Phrase(phrase)
+            if len(phrase) >= len(positions) and self._matches(
+                phrase.syllables, positions
+            ):
+                yield phrase
+
+    def generate_rhymes(self, schemes=RhymeScheme(), length=None):
+        """
+        Yield every phrase whose trailing syllables rhyme position by
+        position, keeping the leading syllables as they are.
+
+        Candidates of each position are generated once from its own vowel
+        rhyme set and validity, then combined lazily. Positions rhyme
+        independently, so every combination is yielded and nothing is pruned
+        across positions: the count is the product of the counts of each
+        position. Use `find_rhymes` to search a lexicon instead.
+        """
+        positions = self._positions(schemes, length)
+        candidates = [
+            tuple(PinYin._generate(*resolved)) for resolved in positions
+        ]
+        prefix = self.syllables[:len(self) - len(positions)]
+        for rhymes in itertools.product(*reversed(candidates)):
+            yield Phrase(prefix + rhymes)
+
+    def _positions(self, schemes, length):
+        if isinstance(schemes, RhymeScheme):
+            length = len(self) if length is None else length
+            schemes = (schemes,) * length
+        else:
+            schemes = tuple(RhymeScheme(*x) for x in schemes)
+        if not 0 < len(schemes) <= len(self):
+            raise ValueError(
+                f'Cannot rhyme {len(schemes)} syllables of "{self}".'
+            )
+        return [
+            self._resolve(syllable, scheme) for (syllable, scheme) in zip(
+                reversed(self.syllables), reversed(schemes)
+            )
+        ]
+
+    def _resolve(self, syllable, scheme):
+        key = (syllable, scheme)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = syllable._resolve(*scheme)
+            self._resolved[key] = resolved
+        return resolved
+
+    @staticmethod
+    def _membership(positions):
+        return [
+            (
+                consonant_mask(consonants),
+                vowel_mask(vowels),
+                sum(1 << x for x in set(tones))
+            ) for (consonants, vowels, tones) in positions
+        ]
+
+    @staticmethod
+    def _matches(syllables, positions):
+        for (syllable, (consonants, vowels, tones)) in zip(
+            reversed(syllables), positions
+        ):
+            if not (
+                vowels >> syllable.vowel._value_ & 1 and
+                tones >> syllable.tone & 1 and
+                consonants >> syllable.consonant._value_ & 1
+            ):
+                return False
+        return True
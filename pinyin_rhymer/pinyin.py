@@ -1,13 +1,18 @@
-import itertools
+import heapq
+import math
 import re
+import threading
+from collections import OrderedDict, namedtuple
 
-from pinyin_rhymer.consonant import Consonant
-from pinyin_rhymer.data.pinyin_list import PINYIN_LIST
-from pinyin_rhymer.error import (
-    NotAPinYinError, IrregularPinYinError, NotARhymeSchemeError
+from pinyin_rhymer.consonant import (
+    ALL_CONSONANTS, FAMILY_MASKS, Consonant, consonant_mask, consonants_of
 )
+from pinyin_rhymer.data import pinyin_list
+from pinyin_rhymer.error import NotAPinYinError, IrregularPinYinError
 from pinyin_rhymer.rhyme_scheme import ConsonantScheme, VowelScheme
-from pinyin_rhymer.vowel import Vowel
+from pinyin_rhymer.vowel import (
+    DEFAULT_MODEL, VOWEL_LOOKUP, Vowel, vowel_mask, vowels_of
+)
 
 TONES = 'āēīōūǖáéíóúǘǎěǐǒǔǚàèìòùǜ'
 REPLACE = 'aāáǎàeēéěèiīíǐìoōóǒòuūúǔùvǖǘǚǜ'
@@ -15,11 +20,13 @@ ZCS = ('z', 'c', 's')
 ZHCHSHR = ('zh', 'ch', 'sh', 'r')
 BPMF = ('b', 'p', 'm', 'f')
 JQX = ('j', 'q', 'x')
+RANK_WEIGHT = 0.1
 IRREGULARS = ('hm', 'hng', 'ń', 'ň', 'ǹ', 'ńg', 'ňg', 'ǹg', 'ḿ', 'm̀')
 _re_consonant = f'(?P<consonant>{"|".join(Consonant.all_as_str())})?'
 _re_vowel = r'(?P<vowel>(?:er|[eaiouvüwy]+(?:n|ng)?))?'
 _re_tone = r'(?P<tone>\d)?'
 RE_PINYIN = re.compile(f'^{_re_consonant}{_re_vowel}{_re_tone}$')
+RE_VOWEL = re.compile(_re_vowel)
 
 
 def convert_unicode_to_alnum(pinyin):
@@ -52,6 +59,29 @@ def transform_vowel(consonant, vowel):
     return vowel.replace('yv', 'yu')
 
 
+def match_pinyin(pinyin):
+    """
+    Consonant, vowel and tone spellings of a pinyin, by regular expression.
+    """
+    if not pinyin.isascii():
+        pinyin = convert_unicode_to_alnum(pinyin)
+    groups = RE_PINYIN.match(pinyin)
+    if not groups:
+        if pinyin in IRREGULARS:
+            raise IrregularPinYinError(pinyin)
+        else:
+            raise NotAPinYinError(pinyin)
+
+    consonant = groups.group('consonant')
+    vowel = groups.group('vowel')
+    if vowel is None:
+        raise NotAPinYinError(pinyin)
+    vowel = transform_vowel(consonant, vowel)
+    tone = groups.group('tone') or 5
+
+    return consonant, vowel, tone
+
+
 def reverse_transform_vowel(consonant, vowel):
     match vowel:
         case 'uo':
@@ -62,36 +92,223 @@ def reverse_transform_vowel(consonant, vowel):
     return vowel
 
 
+class ParseCache(object):
+    """
+    Bounded cache of interned PinYin instances keyed by the raw input spelling.
+
+    `eviction` is either 'LRU', dropping the least recently used spelling, or
+    'FIFO', dropping the oldest one. Every access holds a lock, so the cache
+    can be shared by threads.
+    """
+    EVICTIONS = ('LRU', 'FIFO')
+
+    def __init__(self, maxsize=4096, eviction='LRU'):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.configure(maxsize, eviction)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def configure(self, maxsize=None, eviction=None):
+        if eviction is not None and eviction not in self.EVICTIONS:
+            raise ValueError(f'"{eviction}" is not a valid eviction.')
+        with self._lock:
+            if eviction is not None:
+                self.eviction = eviction
+            if maxsize is not None:
+                self.maxsize = maxsize
+                while len(self._entries) > maxsize:
+                    self._entries.popitem(last=False)
+
+    def get(self, key):
+        with self._lock:
+            pinyin = self._entries.get(key)
+            if pinyin is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.eviction == 'LRU':
+                self._entries.move_to_end(key)
+            return pinyin
+
+    def put(self, key, pinyin):
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._entries[key] = pinyin
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SyllableTable(object):
+    """
+    Parses of every spelling of every syllable the consonant and vowel
+    inventories can form, keyed by the whole spelling.
+
+    Spellings with a numeric tone, a tone mark on any one vowel, `ü` or `v`
+    are all listed, so parsing one is a single dict lookup. The table is
+    generated from `match_pinyin` on first use, and spellings outside it are
+    left to `match_pinyin`.
+    """
+    MARKABLE = 'aeiouv'
+
+    def __init__(self):
+        self._table = None
+
+    def __len__(self):
+        return len(self.load())
+
+    def get(self, pinyin):
+        table = self._table
+        if table is None:
+            table = self.load()
+        return table.get(pinyin)
+
+    def load(self):
+        if self._table is None:
+            table = {}
+            for (body, consonant, vowel) in self._bodies():
+                self._add(table, body, consonant, vowel)
+            self._table = table
+        return self._table
+
+    @staticmethod
+    def _bodies():
+        spellings = {x for x in VOWEL_LOOKUP if isinstance(x, str)}
+        spellings.update(x.spell for x in Vowel)
+        spellings.update([x.replace('u', 'v') for x in spellings])
+        spellings.update([x.replace('v', 'u') for x in spellings])
+        spellings = [x for x in spellings if x and RE_VOWEL.fullmatch(x)]
+        for consonant in Consonant.all_as_str():
+            for spelling in spellings:
+                body = f'{consonant}{spelling}'
+                try:
+                    parsed = match_pinyin(body)
+                except (NotAPinYinError, IrregularPinYinError):
+                    continue
+                if parsed[2] != 5:
+                    continue
+                consonant_member = Consonant.lookup(parsed[0])
+                vowel_member = Vowel.lookup(parsed[1])
+                if consonant_member is not None and vowel_member is not None:
+                    yield body, consonant_member, vowel_member
+
+    def _add(self, table, body, consonant, vowel):
+        parses = [(consonant, vowel, tone) for tone in range(6)]
+        umlauts = [body]
+        if 'v' in body:
+            umlauts.append(body.replace('v', 'ü'))
+        for spelling in umlauts:
+            table[spelling] = parses[5]
+            for tone in range(1, 6):
+                table[f'{spelling}{tone}'] = parses[tone]
+        for (i, letter) in enumerate(body):
+            if letter not in self.MARKABLE:
+                continue
+            for tone in range(1, 5):
+                mark = TONES[(tone - 1) * 6 + self.MARKABLE.index(letter)]
+                marked = f'{body[:i]}{mark}{body[i + 1:]}'
+                table[marked] = parses[tone]
+                table[marked.replace('v', 'ü')] = parses[tone]
+
+
+SYLLABLE_TABLE = SyllableTable()
+PARSE_CACHE = ParseCache()
+_INTERNED = {}
+
+
+RhymeKey = namedtuple('RhymeKey', ('consonant', 'vowels', 'tone'))
+
+
+def is_transitive(vowel_scheme, model=None):
+    """
+    Whether a vowel scheme partitions the vowels, so that equal rhyme keys
+    mean rhyming syllables.
+    """
+    table = (model or DEFAULT_MODEL).rhyme_table
+    return table.classes(VowelScheme(vowel_scheme)).transitive
+
+
+def group_rhymes(
+    syllables,
+    consonant_scheme='ALL',
+    vowel_scheme=VowelScheme.SIMILAR_SOUNDING,
+    tone='SAME',
+    model=None
+):
+    """
+    Syllables grouped by their rhyme key, as a dict of lists.
+    """
+    groups = {}
+    for syllable in syllables:
+        pinyin = PinYin.intern(syllable)
+        key = pinyin.rhyme_key(consonant_scheme, vowel_scheme, tone, model)
+        groups.setdefault(key, []).append(pinyin)
+    return groups
+
+
 class PinYin(object):
     def __init__(self, in_str, vowel=None, tone=1):
         if isinstance(in_str, PinYin):
-            self.consonant = in_str.consonant
-            self.vowel = in_str.vowel
-            self.tone = in_str.tone
-            return
-        consonant = in_str
-        if not vowel:
+            consonant = in_str.consonant
+            vowel = in_str.vowel
+            tone = in_str.tone
+        elif vowel:
+            consonant, vowel = self._members(in_str, vowel)
+        else:
             consonant, vowel, tone = self._parse(in_str)
-        self.consonant = Consonant(consonant)
-        self.vowel = Vowel(vowel)
-        self.tone = int(tone)
+        object.__setattr__(self, 'consonant', consonant)
+        object.__setattr__(self, 'vowel', vowel)
+        object.__setattr__(self, 'tone', int(tone))
+
+    @classmethod
+    def intern(cls, in_str, vowel=None, tone=1):
+        """
+        Return the shared instance of a syllable, parsing each distinct
+        spelling only once while it stays in `PARSE_CACHE`.
+        """
+        if vowel or not isinstance(in_str, str):
+            return _INTERNED.setdefault(
+                *cls._intern_item(cls(in_str, vowel, tone))
+            )
+        pinyin = PARSE_CACHE.get(in_str)
+        if pinyin is None:
+            pinyin = _INTERNED.setdefault(*cls._intern_item(cls(in_str)))
+            PARSE_CACHE.put(in_str, pinyin)
+        return pinyin
+
+    @staticmethod
+    def _intern_item(pinyin):
+        return (pinyin.consonant, pinyin.vowel, pinyin.tone), pinyin
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{self.__class__.__name__} is immutable.')
 
     def _parse(self, pinyin):
-        if not pinyin.isascii():
-            pinyin = convert_unicode_to_alnum(pinyin)
-        groups = RE_PINYIN.match(pinyin)
-        if not groups:
-            if pinyin in IRREGULARS:
-                raise IrregularPinYinError(pinyin)
-            else:
-                raise NotAPinYinError(pinyin)
-
-        consonant = groups.group('consonant')
-        vowel = groups.group('vowel')
-        vowel = transform_vowel(consonant, vowel)
-        tone = groups.group('tone') or 5
-
-        return consonant, vowel, tone
+        parsed = SYLLABLE_TABLE.get(pinyin)
+        if parsed is None:
+            consonant, vowel, tone = match_pinyin(pinyin)
+            return (*self._members(consonant, vowel), tone)
+        return parsed
+
+    @staticmethod
+    def _members(consonant, vowel):
+        return (
+            Consonant.lookup(consonant) or Consonant(consonant),
+            Vowel.lookup(vowel) or Vowel(vowel)
+        )
 
     def __repr__(self):
         return f'{self.__class__.__name__}("{str(self)}")'
@@ -107,6 +324,9 @@ class PinYin(object):
 
     @property
     def is_valid(self):
+        return VALIDITY_INDEX.is_valid(self.consonant, self.vowel, self.tone)
+
+    def _is_listed(self):
         consonant = str(self.consonant)
         match self.vowel:
             case Vowel.r:
@@ -118,7 +338,21 @@ class PinYin(object):
             case Vowel.wu:
                 if consonant in JQX:
                     return False
-        return self.with_tone_mark() in PINYIN_LIST
+        return self.with_tone_mark() in pinyin_list.PINYIN_LIST
+
+    @property
+    def characters(self):
+        return pinyin_list.PINYIN_ZI_DICT.characters(self.with_tone_mark())
+
+    @property
+    def count(self):
+        """
+        Number of characters read as this syllable.
+        """
+        try:
+            return pinyin_list.PINYIN_ZI_DICT.count(self.with_tone_mark())
+        except KeyError:
+            return 0
 
     def __str__(self):
         return f'{self.consonant}{self.spell_vowel}{self.tone}'
@@ -146,7 +380,7 @@ class PinYin(object):
             replace = vowel[vowel.index('n')-1]
         else:
             replace = vowel[1]
-        if self.consonant not in JQX:
+        if self.consonant in ('n', 'l'):
             vowel = vowel.replace('ue', 'üe')
         vowel = vowel.replace(
             replace, REPLACE[REPLACE.index(replace) + (self.tone % 5)]
@@ -158,65 +392,200 @@ class PinYin(object):
         other,
         consonant_scheme='ALL',
         vowel_scheme=VowelScheme.SIMILAR_SOUNDING,
-        tone='SAME'
+        tone='SAME',
+        model=None
+    ):
+        if not isinstance(other, PinYin):
+            other = PinYin.intern(other)
+        if tone == 'SAME' and other.tone != self.tone:
+            return False
+        match ConsonantScheme.lookup(consonant_scheme):
+            case ConsonantScheme.ALL:
+                pass
+            case ConsonantScheme.FAMILY:
+                if other.consonant.family is not self.consonant.family:
+                    return False
+            case _:
+                consonants = self._consonant_mask(consonant_scheme)
+                if not consonants >> other.consonant._value_ & 1:
+                    return False
+        scheme = VowelScheme.lookup(vowel_scheme)
+        if scheme is None:
+            vowels = self._vowel_mask(vowel_scheme, model)
+            return bool(vowels >> other.vowel._value_ & 1)
+        classes = (model or DEFAULT_MODEL).rhyme_table.classes(scheme)
+        return bool(classes.masks[self.vowel] >> other.vowel._value_ & 1)
+
+    def rhyme_key(
+        self,
+        consonant_scheme='ALL',
+        vowel_scheme=VowelScheme.SIMILAR_SOUNDING,
+        tone='SAME',
+        model=None
     ):
-        other = PinYin(other)
-        rhyme_consonant = (
-            other.consonant in self._get_consonant_list(consonant_scheme)
+        """
+        Hashable RhymeKey of this syllable under a consonant and vowel
+        scheme.
+
+        When `is_transitive` holds for the vowel scheme, two syllables rhyme
+        exactly when their keys are equal, so a dict groups them into rhyme
+        classes. Otherwise the vowel part is the bitmask of the neighbouring
+        vowels, and equal keys only mean identical neighbours.
+        """
+        match ConsonantScheme(consonant_scheme):
+            case ConsonantScheme.ALL:
+                consonant = None
+            case ConsonantScheme.FAMILY:
+                consonant = self.consonant.family
+        classes = (model or DEFAULT_MODEL).rhyme_table.classes(
+            VowelScheme(vowel_scheme)
         )
-        rhyme_vowel = (
-            other.vowel in self._get_vowel_list(vowel_scheme)
+        return RhymeKey(
+            consonant,
+            classes.masks[self.vowel],
+            self.tone if tone == 'SAME' else None
         )
-        rhyme_tone = tone != 'SAME' or other.tone == self.tone
-        return rhyme_consonant and rhyme_vowel and rhyme_tone
 
     def generate_rhymes(
         self,
         consonants='ALL',
         vowels=VowelScheme.SIMILAR_SOUNDING,
-        tones=None
+        tones=None,
+        model=None
+    ):
+        yield from self._generate(
+            *self._resolve(consonants, vowels, tones, model)
+        )
+
+    def rhyme_score(self, other, weight=RANK_WEIGHT, model=None):
+        """
+        Phonetic distance of the vowels under `model`, less `weight` times
+        the log frequency of `other`, so lower scores rank first.
+        """
+        return (
+            self.vowel.distance(other.vowel, model) -
+            weight * math.log1p(other.count)
+        )
+
+    def rank_rhymes(
+        self,
+        consonants='ALL',
+        vowels=VowelScheme.SIMILAR_SOUNDING,
+        tones=None,
+        top=None,
+        weight=RANK_WEIGHT,
+        model=None
     ):
-        consonants = self._get_consonant_list(consonants)
-        vowels = self._get_vowel_list(vowels)
+        """
+        Rhymes sorted by `rhyme_score`, ties broken by consonant, vowel and
+        tone. With `top`, only the best `top` candidates are kept in a heap
+        while generating.
+        """
+        rhymes = self.generate_rhymes(consonants, vowels, tones, model)
+
+        def key(pinyin):
+            return (
+                self.rhyme_score(pinyin, weight, model),
+                pinyin.consonant._value_,
+                pinyin.vowel._value_,
+                pinyin.tone
+            )
+
+        if top is None:
+            return sorted(rhymes, key=key)
+        return heapq.nsmallest(top, rhymes, key=key)
+
+    def _resolve(self, consonants, vowels, tones, model=None):
+        consonants = consonants_of(self._consonant_mask(consonants))
+        vowels = vowels_of(self._vowel_mask(vowels, model))
         tones = tones and self._get_tone_list(tones) or (self.tone,)
+        return consonants, vowels, tuple(map(int, tones))
+
+    @staticmethod
+    def _generate(consonants, vowels, tones):
         for consonant in consonants:
             for vowel in vowels:
+                valid_tones = VALIDITY_INDEX.tones(consonant, vowel)
+                if not valid_tones:
+                    continue
                 for tone in tones:
-                    pinyin = PinYin(consonant, vowel, tone)
-                    if pinyin.is_valid:
-                        yield pinyin
+                    if valid_tones >> tone & 1:
+                        yield PinYin.intern(consonant, vowel, tone)
 
     def _get_consonant_list(self, consonants):
-        try:
-            consonants = ConsonantScheme(consonants)
-        except NotARhymeSchemeError:
+        return consonants_of(self._consonant_mask(consonants))
+
+    def _get_vowel_list(self, vowels, model=None):
+        return vowels_of(self._vowel_mask(vowels, model))
+
+    def _consonant_mask(self, consonants):
+        match ConsonantScheme.lookup(consonants):
+            case ConsonantScheme.ALL:
+                return ALL_CONSONANTS
+            case ConsonantScheme.FAMILY:
+                return FAMILY_MASKS[self.consonant.family]
+        if isinstance(consonants, Consonant):
+            return 1 << consonants._value_
+        if isinstance(consonants, str):
             # 'bpmf'
-            return (Consonant(x) for x in consonants)
-        except TypeError:
-            # ('b', 'p', 'm', 'f') or ('FAMILY', 'b', 'p', 'm', 'f')
-            return itertools.chain.from_iterable(
-                self._get_consonant_list(x) for x in consonants
-            )
-        else:
-            match consonants:
-                case ConsonantScheme.ALL:
-                    return Consonant.all()
-                case ConsonantScheme.FAMILY:
-                    return self.consonant.all_family()
+            return consonant_mask(Consonant(x) for x in consonants)
+        # ('b', 'p', 'm', 'f') or ('FAMILY', 'b', 'p', 'm', 'f')
+        mask = 0
+        for each in consonants:
+            mask |= self._consonant_mask(each)
+        return mask
 
-    def _get_vowel_list(self, vowels):
-        try:
-            vowels = VowelScheme(vowels)
-        except NotARhymeSchemeError:
-            return (Vowel(x) for x in re.split(r'[\s\t,]+', vowels))
-        except TypeError:
-            return itertools.chain.from_iterable(
-                self._get_vowel_list(x) for x in vowels
-            )
-        else:
-            return self.vowel.rhyme(vowels)
+    def _vowel_mask(self, vowels, model=None):
+        scheme = VowelScheme.lookup(vowels)
+        if scheme is not None:
+            table = (model or DEFAULT_MODEL).rhyme_table
+            return table.classes(scheme).masks[self.vowel]
+        if isinstance(vowels, Vowel):
+            return 1 << vowels._value_
+        if isinstance(vowels, str):
+            spellings = re.split(r'[\s\t,]+', vowels)
+            return vowel_mask(Vowel(x) for x in spellings)
+        # ('FOURTEEN_RHYMES', 'SIMILAR_TAIL') or ('ai', 'ei')
+        mask = 0
+        for each in vowels:
+            mask |= self._vowel_mask(each, model)
+        return mask
 
     def _get_tone_list(self, tones):
         if tones == 'ALL':
             return range(1, 6)
         return tones
+
+
+class ValidityIndex(object):
+    """
+    Bitmask of the tones each consonant and vowel pair is listed with in
+    PINYIN_LIST, so validity is checked without building any string.
+    """
+    _STRIDE = len(Vowel) + 1
+
+    def __init__(self):
+        self._masks = None
+
+    def tones(self, consonant, vowel):
+        if self._masks is None:
+            self._masks = self._build()
+        return self._masks[consonant._value_ * self._STRIDE + vowel._value_]
+
+    def is_valid(self, consonant, vowel, tone):
+        return bool(self.tones(consonant, vowel) >> tone & 1)
+
+    def _build(self):
+        masks = bytearray(len(Consonant) * self._STRIDE)
+        for consonant in Consonant:
+            for vowel in Vowel:
+                if vowel is Vowel.Empty:
+                    continue
+                index = consonant._value_ * self._STRIDE + vowel._value_
+                for tone in range(1, 6):
+                    if PinYin(consonant, vowel, tone)._is_listed():
+                        masks[index] |= 1 << tone
+        return bytes(masks)
+
+
+VALIDITY_INDEX = ValidityIndex()
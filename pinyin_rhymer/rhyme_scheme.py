@@ -6,13 +6,34 @@ from pinyin_rhymer.error import NotARhymeSchemeError
 class SchemeMethods(Enum):
     @classmethod
     def _missing_(cls, name):
+        scheme = cls.lookup(name)
+        if scheme is None:
+            raise NotARhymeSchemeError(name, cls)
+        return scheme
+
+    @classmethod
+    def lookup(cls, name, default=None):
+        """
+        Scheme of a member or name, or `default`, without raising.
+        """
         if isinstance(name, cls):
             return name
-        try:
-            name = cls.__members__[name]
-        except KeyError:
-            raise NotARhymeSchemeError(name, cls)
-        return cls(name)
+        if isinstance(name, str):
+            return cls.__members__.get(name, default)
+        return default
+
+
+def parse_tones(value):
+    """
+    Tones of a query string: None for the same tone, 'ALL', or a tuple of
+    tone numbers written as 14 or 1,4.
+    """
+    if value is None or value == 'ALL':
+        return value
+    tones = value.replace(',', '').replace(' ', '')
+    if not tones or any(x not in '12345' for x in tones):
+        raise NotARhymeSchemeError(value, 'tone scheme')
+    return tuple(map(int, tones))
 
 
 class ConsonantScheme(SchemeMethods):
@@ -0,0 +1,123 @@
+"""
+Segmentation of continuous pinyin into syllables.
+
+    >>> segment('xianzaiwomen')
+    ['xian', 'zai', 'wo', 'men']
+    >>> segment("xiānzài xi'an")
+    ['xiān', 'zài', 'xi', 'an']
+
+Whitespace, apostrophes, hyphens and zero-width characters always separate
+syllables. Between them the split with the fewest syllables wins, and ties
+go to the split of more common syllables, by their character counts in
+`pinyin_list.csv`. The syllables are walked in a trie of every listed
+spelling, with or without a tone number or tone mark, so the time is linear
+in the length of the text.
+"""
+import math
+import re
+
+from pinyin_rhymer.data import pinyin_list
+from pinyin_rhymer.error import PARSE_ERRORS, NotAPinYinError
+from pinyin_rhymer.pinyin import SYLLABLE_TABLE, TONES, VALIDITY_INDEX, PinYin
+
+RE_SEPARATOR = re.compile(r"[\s'’\-\u200b-\u200d\u2060\ufeff]+")
+END = None
+
+
+class Segmenter(object):
+    """
+    Trie of the spellings of every listed syllable, weighted by character
+    count, built on first use.
+    """
+
+    def __init__(self):
+        self._trie = None
+
+    def load(self):
+        if self._trie is None:
+            self._trie = self._build()
+        return self._trie
+
+    @staticmethod
+    def _counts():
+        counts = {}
+        for (syllable, count) in pinyin_list.PINYIN_ZI_DICT.counts():
+            try:
+                pinyin = PinYin(syllable)
+            except PARSE_ERRORS:
+                continue
+            for key in (
+                (pinyin.consonant, pinyin.vowel, pinyin.tone),
+                (pinyin.consonant, pinyin.vowel, None),
+            ):
+                counts[key] = counts.get(key, 0) + count
+        return counts
+
+    def _build(self):
+        counts = self._counts()
+        trie = {}
+        for (spelling, parsed) in SYLLABLE_TABLE.load().items():
+            consonant, vowel, tone = parsed
+            if not VALIDITY_INDEX.tones(consonant, vowel):
+                continue
+            toned = spelling[-1].isdigit() or any(x in TONES for x in spelling)
+            count = counts.get((consonant, vowel, tone if toned else None))
+            if count is None:
+                continue
+            node = trie
+            for letter in spelling:
+                node = node.setdefault(letter, {})
+            node[END] = math.log1p(count)
+        return trie
+
+    def segment(self, text):
+        """
+        Syllables of a continuous pinyin text, lowercased.
+        """
+        syllables = []
+        for run in RE_SEPARATOR.split(text.lower()):
+            if run:
+                syllables.extend(self._segment_run(run))
+        return syllables
+
+    def _segment_run(self, run):
+        trie = self.load()
+        # best[i] is (syllables, -weight, start) of the best split of run[:i]
+        best = [None] * (len(run) + 1)
+        best[0] = (0, 0.0, 0)
+        for start in range(len(run)):
+            if best[start] is None:
+                continue
+            length, weight, _ = best[start]
+            node = trie
+            for end in range(start + 1, len(run) + 1):
+                node = node.get(run[end - 1])
+                if node is None:
+                    break
+                if END in node:
+                    candidate = (length + 1, weight - node[END], start)
+                    if best[end] is None or candidate < best[end]:
+                        best[end] = candidate
+        if best[-1] is None:
+            raise NotAPinYinError(run)
+        syllables = []
+        end = len(run)
+        while end:
+            start = best[end][2]
+            syllables.append(run[start:end])
+            end = start
+        return syllables[::-1]
+
+
+SEGMENTER = Segmenter()
+
+
+def segment(text):
+    return SEGMENTER.segment(text)
+
+
+def segment_pinyin(text):
+    """
+    Interned PinYin of every syllable of a continuous pinyin text.
+    """
+    return [PinYin.intern(x) for x in segment(text)]
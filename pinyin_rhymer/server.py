@@ -0,0 +1,195 @@
+"""
+Minimal asyncio HTTP/JSON rhyme service, using the standard library only.
+
+    python -m pinyin_rhymer.server --port 8000
+
+    GET /rhyme?source=ai4&consonants=ALL&vowels=SIMILAR_SOUNDING&tones=1,4
+    GET /rhymes_with?this=ai4&other=kuai4&vowels=FOURTEEN_RHYMES&tone=SAME
+    GET /characters?pinyin=le4
+    GET /readings?zi=乐
+    GET /stats
+
+Identical requests in flight share one evaluation, which runs in an
+executor so scheme evaluation does not block the event loop.
+"""
+import argparse
+import asyncio
+import json
+import time
+from functools import partial
+from urllib.parse import parse_qsl, urlsplit
+
+from pinyin_rhymer import hanzi, rhyme_with
+from pinyin_rhymer.error import (
+    IrregularPinYinError, NotAConsonantError, NotAPinYinError,
+    NotARhymeSchemeError, NotAVowelError
+)
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.rhyme_scheme import parse_tones
+
+CLIENT_ERRORS = (
+    IrregularPinYinError, NotAConsonantError, NotAPinYinError,
+    NotARhymeSchemeError, NotAVowelError
+)
+REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+    405: 'Method Not Allowed', 500: 'Internal Server Error'
+}
+
+
+def _rhyme(source, consonants='ALL', vowels='SIMILAR_SOUNDING', tones=None):
+    tones = parse_tones(tones)
+    return [str(x) for x in rhyme_with(source, consonants, vowels, tones)]
+
+
+def _rhymes_with(
+    this, other, consonants='ALL', vowels='SIMILAR_SOUNDING', tone='SAME'
+):
+    return PinYin.intern(this).rhymes_with(other, consonants, vowels, tone)
+
+
+def _characters(pinyin):
+    return list(PinYin.intern(pinyin).characters)
+
+
+def _readings(zi):
+    return [x.with_tone_mark() for x in hanzi.readings(zi)]
+
+
+ENDPOINTS = {
+    '/rhyme': _rhyme,
+    '/rhymes_with': _rhymes_with,
+    '/characters': _characters,
+    '/readings': _readings,
+}
+
+
+class Stats(object):
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record(self, latency, error=False):
+        self.requests += 1
+        self.errors += error
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def as_dict(self):
+        uptime = time.monotonic() - self.started
+        return {
+            'requests': self.requests,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+            'latency_mean': self.latency_total / (self.requests or 1),
+            'latency_max': self.latency_max,
+            'throughput': self.requests / uptime if uptime else 0.0,
+            'uptime': uptime,
+        }
+
+
+class RhymeServer(object):
+    """
+    `executor` runs the endpoints, the event loop's default one if None. A
+    ProcessPoolExecutor spreads heavy schemes over several cores.
+    """
+
+    def __init__(self, executor=None):
+        self.executor = executor
+        self.stats = Stats()
+        self._in_flight = {}
+
+    async def dispatch(self, path, params):
+        """
+        Status and JSON payload of a request.
+        """
+        if path == '/stats':
+            return 200, self.stats.as_dict()
+        endpoint = ENDPOINTS.get(path)
+        if endpoint is None:
+            return 404, {'error': f'"{path}" is not an endpoint.'}
+        key = (path, tuple(sorted(params.items())))
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._evaluate(endpoint, params))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key))
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(future)
+
+    async def _evaluate(self, endpoint, params):
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                self.executor, partial(endpoint, **params)
+            )
+        except CLIENT_ERRORS as e:
+            return 400, {'error': str(e)}
+        except TypeError:
+            return 400, {'error': 'Missing or unexpected parameters.'}
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': f'{e.__class__.__name__}: {e}'}
+        return 200, result
+
+    async def handle(self, reader, writer):
+        start = time.perf_counter()
+        status = 400
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()).strip():
+                pass
+            try:
+                method, target, _ = request_line.decode('utf-8').split()
+            except ValueError:
+                payload = {'error': 'Malformed request.'}
+            else:
+                if method == 'GET':
+                    url = urlsplit(target)
+                    status, payload = await self.dispatch(
+                        url.path, dict(parse_qsl(url.query))
+                    )
+                else:
+                    status, payload = 405, {'error': 'Only GET is served.'}
+            self._respond(writer, status, payload)
+            await writer.drain()
+        finally:
+            writer.close()
+            self.stats.record(time.perf_counter() - start, status != 200)
+
+    @staticmethod
+    def _respond(writer, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+            'Content-Type: application/json; charset=utf-8\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            'Connection: close\r\n\r\n'.encode('ascii') + body
+        )
+
+    async def start(self, host='127.0.0.1', port=8000):
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def serve(host='127.0.0.1', port=8000):
+    server = await RhymeServer().start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve pinyin rhymes.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Streaming tokenizer and annotator for large pinyin texts.
+
+Text is read in chunks and split into syllable tokens: runs of latin letters,
+`ü`, tone-marked vowels in either case and the tone marks of irregulars,
+optionally followed by a tone number, so `ni3hao3` yields `ni3` and `hao3`.
+Everything else is a separator. Every token becomes a Record, with `error`
+holding the exception raised by a token that is not a regular pinyin instead
+of raising it. A token that does not parse as one syllable but segments into
+several, such as `Wǒmen`, becomes a Record per syllable.
+"""
+import re
+from collections import namedtuple
+from pathlib import Path
+
+from pinyin_rhymer.error import PARSE_ERRORS, NotAPinYinError
+from pinyin_rhymer.pinyin import TONES, PinYin
+from pinyin_rhymer.segment import SEGMENTER
+
+CHUNK_SIZE = 1 << 16
+RE_TOKEN = re.compile(
+    f'[a-zA-ZüÜ{TONES}{TONES.upper()}ńňǹḿŃŇǸḾ̀]+[0-9]?'
+)
+
+Record = namedtuple(
+    'Record', ('token', 'pinyin', 'consonant', 'vowel', 'tone', 'error')
+)
+
+
+def read_chunks(source, size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    Yield chunks of text from a path or a text file object.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding=encoding) as f:
+            yield from read_chunks(f, size)
+        return
+    while chunk := source.read(size):
+        yield chunk
+
+
+def iter_tokens(chunks):
+    """
+    Yield the syllable tokens of a text split in chunks anywhere, holding back
+    a token touching the end of a chunk until the next one arrives.
+    """
+    tail = ''
+    for chunk in chunks:
+        text = tail + chunk
+        tail = ''
+        for match in RE_TOKEN.finditer(text):
+            if match.end() == len(text):
+                tail = match.group()
+                break
+            yield match.group()
+    if tail:
+        yield tail
+
+
+def annotate(tokens):
+    for token in tokens:
+        try:
+            pinyin = PinYin.intern(token.lower())
+        except PARSE_ERRORS as e:
+            try:
+                yield from _annotate_joined(token)
+            except PARSE_ERRORS:
+                yield Record(token, None, None, None, None, e)
+        else:
+            yield _record(token, pinyin)
+
+
+def _annotate_joined(token):
+    syllables = SEGMENTER.segment(token)
+    if len(syllables) < 2:
+        raise NotAPinYinError(token)
+    pinyins = [PinYin.intern(x) for x in syllables]
+    start = 0
+    for (syllable, pinyin) in zip(syllables, pinyins):
+        end = start + len(syllable)
+        yield _record(token[start:end], pinyin)
+        start = end
+
+
+def _record(token, pinyin):
+    return Record(
+        token, pinyin, pinyin.consonant, pinyin.vowel, pinyin.tone, None
+    )
+
+
+def annotate_file(source, size=CHUNK_SIZE, encoding='utf-8'):
+    return annotate(iter_tokens(read_chunks(source, size, encoding)))
@@ -0,0 +1,136 @@
+"""
+Optional NumPy backend computing the similarity schemes of every vowel pair
+at once, for any threshold or many of them.
+
+Install the `numpy` extra to use it, then call `enable()` to build the
+SIMILAR_BODY, SIMILAR_TAIL and SIMILAR_SOUNDING rows of `RHYME_TABLE`, or of
+the rhyme table of any PhoneticModel, with it. Without NumPy the pure Python
+schemes in `vowel` are used.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pinyin_rhymer.rhyme_scheme import VowelScheme
+from pinyin_rhymer.vowel import (
+    DEFAULT_MODEL, RHYME_TABLE, Monophthong, Vowel
+)
+
+VOWELS = tuple(x for x in Vowel if x is not Vowel.Empty)
+MONOPHTHONGS = tuple(x.name for x in Monophthong)
+SCHEMES = (
+    VowelScheme.SIMILAR_BODY,
+    VowelScheme.SIMILAR_TAIL,
+    VowelScheme.SIMILAR_SOUNDING,
+)
+
+
+def available():
+    return np is not None
+
+
+class VowelSpace(object):
+    """
+    (openness, backness) coordinates of all vowels and monophthongs under a
+    PhoneticModel, with their pairwise distances precomputed as matrices.
+    """
+
+    def __init__(self, model=None):
+        if np is None:
+            raise ImportError('The NumPy backend requires numpy.')
+        self.model = model = model or DEFAULT_MODEL
+        monophthongs = np.array([model.position(x) for x in MONOPHTHONGS])
+        bodies = np.array([model.altered_nucleus(x) for x in VOWELS])
+        tails = [MONOPHTHONGS.index(x.coda or x.nucleus) for x in VOWELS]
+        body_delta = np.abs(bodies[:, None, :] - monophthongs[None, :, :])
+        self.body_distance = np.hypot(body_delta[..., 0], body_delta[..., 1])
+        self.body_deviation = body_delta.max(axis=-1)
+        tail_delta = np.abs(
+            monophthongs[:, None, :] - monophthongs[None, :, :]
+        )
+        monophthong_distance = np.hypot(
+            tail_delta[..., 0], tail_delta[..., 1]
+        )
+        self.tail_distance = monophthong_distance[np.ix_(tails, tails)]
+
+    def similar_nucleus(self, thresholds):
+        """
+        Boolean matrices [threshold, vowel, rhyme] of SIMILAR_BODY.
+        """
+        thresholds = np.asarray(thresholds, dtype=float)[:, None, None]
+        similar = (self.body_distance < thresholds).astype(np.uint8)
+        close = (self.body_deviation < thresholds).astype(np.uint8)
+        return np.matmul(similar, close.transpose(0, 2, 1)) > 0
+
+    def similar_coda(self, thresholds):
+        """
+        Boolean matrices [threshold, vowel, rhyme] of SIMILAR_TAIL.
+        """
+        thresholds = np.asarray(thresholds, dtype=float)[:, None, None]
+        return self.tail_distance < thresholds
+
+    def similar_sounding(self, thresholds):
+        """
+        Boolean matrices [threshold, vowel, rhyme] of SIMILAR_SOUNDING.
+        """
+        return self.similar_nucleus(thresholds) & self.similar_coda(thresholds)
+
+    def sweep(self, rhymescheme, mores):
+        """
+        Rows of rhymes per vowel for each `more` level of a scheme, computed
+        in one pass.
+        """
+        rhymescheme = VowelScheme(rhymescheme)
+        match rhymescheme:
+            case VowelScheme.SIMILAR_BODY:
+                matrices = self.similar_nucleus(self._thresholds(mores))
+            case VowelScheme.SIMILAR_TAIL:
+                matrices = self.similar_coda(self._thresholds(mores))
+            case VowelScheme.SIMILAR_SOUNDING:
+                matrices = self.similar_sounding(self._thresholds(
+                    self.model.sounding_more(x) for x in mores
+                ))
+            case _:
+                raise ValueError(f'{rhymescheme} is not vectorized.')
+        return [self.to_row(x) for x in matrices]
+
+    def _thresholds(self, mores):
+        return [self.model.similar_threshold(x) for x in mores]
+
+    @staticmethod
+    def to_row(matrix):
+        row = {Vowel.Empty: frozenset()}
+        for (vowel, rhymes) in zip(VOWELS, matrix):
+            row[vowel] = frozenset(
+                VOWELS[x] for x in np.flatnonzero(rhymes)
+            )
+        return row
+
+
+class NumpyBackend(object):
+    def __init__(self, space=None):
+        self.space = space or VowelSpace()
+
+    def build_row(self, rhymescheme, more):
+        if rhymescheme not in SCHEMES:
+            return None
+        return self.space.sweep(rhymescheme, [more])[0]
+
+
+def enable(table=RHYME_TABLE):
+    table.backend = NumpyBackend(VowelSpace(table.model))
+
+
+def disable(table=RHYME_TABLE):
+    table.backend = None
+
+
+def preload(mores, table=RHYME_TABLE):
+    """
+    Fill the vectorized rows of `table` for many `more` levels at once.
+    """
+    space = VowelSpace(table.model)
+    for rhymescheme in SCHEMES:
+        for (more, row) in zip(mores, space.sweep(rhymescheme, mores)):
+            table.add_row(rhymescheme, more, row)
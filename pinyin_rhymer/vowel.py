@@ -1,5 +1,8 @@
 import math
+from collections import namedtuple
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache, lru_cache
 
 from pinyin_rhymer.error import NotAVowelError
 from pinyin_rhymer.rhyme_scheme import VowelScheme
@@ -133,28 +136,36 @@ class MouthMovement(Enum):
 
     @classmethod
     def get_movement(cls, source, target, threshold=0.15):
-        openness = cls.cmp(target.openness, source.openness, threshold)
-        backness = cls.cmp(target.backness, source.backness, threshold)
+        return cls.movement_between(source.value, target.value, threshold)
+
+    @classmethod
+    def movement_between(cls, source, target, threshold=0.15):
+        openness = cls.cmp(target[0], source[0], threshold)
+        backness = cls.cmp(target[1], source[1], threshold)
         return MouthMovement((openness, backness))
 
     @classmethod
-    def calculate(cls, vowel, threshold):
-        if vowel == Vowel.Empty:
+    def calculate(cls, vowel, threshold, model=None):
+        classes, _ = (model or DEFAULT_MODEL).mouth_movements(threshold)
+        return classes[vowel]
+
+    @classmethod
+    def classify(cls, vowel, positions, threshold):
+        """
+        Movement of a vowel, given the positions of its monophthongs.
+        """
+        if vowel is Vowel.Empty:
             return (None, None)
-        try:
-            source = Monophthong(vowel.nucleus)
-        except KeyError:
+        source = positions.get(vowel.nucleus)
+        if source is None:
             return MouthMovement.NO_MOVEMENT
-
-        try:
-            target = Monophthong(vowel.coda)
-        except KeyError:
+        target = positions.get(vowel.coda)
+        if target is None:
             if not vowel.medial:
                 return MouthMovement.NO_MOVEMENT
             target = source
-            source = Monophthong(vowel.medial)
-
-        return cls.get_movement(source, target, threshold)
+            source = positions[vowel.medial]
+        return cls.movement_between(source, target, threshold)
 
 
 class Vowel(Enum):
@@ -214,14 +225,20 @@ class Vowel(Enum):
 
     @classmethod
     def _missing_(cls, s):
-        if not s:
-            return Vowel.Empty
-        if s in VOWEL_TRANSLATION:
-            s = VOWEL_TRANSLATION[s]
-        try:
-            return Vowel[s]
-        except KeyError:
-            raise NotAVowelError(s)
+        vowel = cls.lookup(s)
+        if vowel is None:
+            raise NotAVowelError(VOWEL_TRANSLATION.get(s, s))
+        return vowel
+
+    @classmethod
+    def lookup(cls, s, default=None):
+        """
+        Vowel of a name, VOWEL_TRANSLATION spelling or value, or `default`,
+        without raising.
+        """
+        if s.__hash__ is None:
+            return default
+        return VOWEL_LOOKUP.get(s, default)
 
     @property
     def with_consonant(self):
@@ -235,11 +252,26 @@ class Vowel(Enum):
             self.name
         )
 
+    def distance(self, other, model=None):
+        """
+        Distance between the altered nuclei plus distance between the tails
+        of two vowels, in the (openness, backness) space of a PhoneticModel.
+        """
+        return _vowel_distance(self, other, model or DEFAULT_MODEL)
+
     def rhyme(self, rhymescheme, *args, **kwargs):
         if self == Vowel.Empty:
-            return {}
-        if not isinstance(rhymescheme, VowelScheme):
-            rhymescheme = VowelScheme(rhymescheme)
+            return frozenset()
+        rhymescheme = (
+            VowelScheme.lookup(rhymescheme) or VowelScheme(rhymescheme)
+        )
+        if not args and kwargs.keys() <= {'more', 'model'}:
+            model = kwargs.get('model') or DEFAULT_MODEL
+            more = kwargs.get('more', 0)
+            return model.rhyme_table.lookup(self, rhymescheme, more)
+        return self._rhyme(rhymescheme, *args, **kwargs)
+
+    def _rhyme(self, rhymescheme, *args, **kwargs):
         match rhymescheme:
             case VowelScheme.FOURTEEN_RHYMES:
                 return self._fourteen_rhymes(*args, **kwargs)
@@ -276,23 +308,27 @@ class Vowel(Enum):
         )}
 
     def _similar_nucleus(self, *args, **kwargs):
-        threshold = 0.1 + kwargs.get('more', 0) * 0.1
-        body = Multiphthong.altered_nucleus(self)
-        similar = Monophthong.similar_to(body, threshold=threshold)
+        model = kwargs.get('model') or DEFAULT_MODEL
+        threshold = model.similar_threshold(kwargs.get('more', 0))
+        body = model.altered_nucleus(self)
+        similar = [
+            model.position(x) for x in model.similar_to(body, threshold)
+        ]
         return {
             x for x in Vowel if x is not Vowel.Empty and any(
                 Multiphthong.compare_average(
-                    Multiphthong.altered_nucleus(x),
-                    y.value,
+                    model.altered_nucleus(x),
+                    y,
                     threshold=threshold
                 ) for y in similar
             )
         }
 
     def _similar_coda(self, *args, **kwargs):
-        threshold = 0.1 + kwargs.get('more', 0) * 0.1
-        tail = Monophthong(self.coda or self.nucleus)
-        similar = {x.name for x in tail.similar(threshold=threshold)}
+        model = kwargs.get('model') or DEFAULT_MODEL
+        threshold = model.similar_threshold(kwargs.get('more', 0))
+        tail = model.position(self.coda or self.nucleus)
+        similar = model.similar_to(tail, threshold)
         return {
             x for x in Vowel if (
                 x.coda in similar if x.coda else x.nucleus in similar
@@ -300,18 +336,17 @@ class Vowel(Enum):
         }
 
     def _similar_sounding(self, *args, **kwargs):
-        more = kwargs.pop('more', 0) * 0.75
-        body_rhymes = self._similar_nucleus(*args, more=more+0.25, **kwargs)
-        tail_rhymes = self._similar_coda(*args, more=more+0.25, **kwargs)
-        return body_rhymes.intersection(tail_rhymes)
+        model = kwargs.get('model') or DEFAULT_MODEL
+        more = model.sounding_more(kwargs.pop('more', 0))
+        body_rhymes = self._similar_nucleus(*args, more=more, **kwargs)
+        tail_rhymes = self._similar_coda(*args, more=more, **kwargs)
+        return body_rhymes & tail_rhymes
 
     def _similar_mouth_movement(self, *args, **kwargs):
-        threshold = 0.15 + kwargs.get('more', 0) * 0.15
-        self_movement = MouthMovement.calculate(self, threshold=threshold)
-        return {
-            x for x in Vowel if
-            MouthMovement.calculate(x, threshold=threshold) == self_movement
-        }
+        model = kwargs.get('model') or DEFAULT_MODEL
+        threshold = model.movement_threshold(kwargs.get('more', 0))
+        classes, members = model.mouth_movements(threshold)
+        return members[classes[self]]
 
     def _additive_rhymes(self, *args, **kwargs):
         cls = self.__class__
@@ -336,3 +371,222 @@ class Vowel(Enum):
                 not x.medial and not x.coda
             )
         )}
+
+
+@cache
+def _vowel_distance(this, other, model):
+    if Vowel.Empty in (this, other):
+        return 0.0 if this is other else math.inf
+    body = math.dist(
+        model.altered_nucleus(this), model.altered_nucleus(other)
+    )
+    tail = math.dist(
+        model.position(this.coda or this.nucleus),
+        model.position(other.coda or other.nucleus)
+    )
+    return body + tail
+
+
+RhymeClasses = namedtuple('RhymeClasses', ('masks', 'transitive'))
+
+
+def vowel_mask(vowels):
+    """
+    Bitmask of vowels, bit `vowel._value_` standing for each vowel.
+    """
+    mask = 0
+    for vowel in vowels:
+        mask |= 1 << vowel._value_
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def vowels_of(mask):
+    """
+    Vowels of a bitmask, in definition order.
+    """
+    return tuple(x for x in Vowel if mask >> x._value_ & 1)
+
+
+class RhymeTable(object):
+    """
+    Immutable rhymes of every vowel, one row per rhyme scheme and `more` level.
+
+    A row is computed for all vowels at once on its first lookup under the
+    table's PhoneticModel, and served from memory afterwards. `backend`, if
+    set, may build rows in place of the pure Python schemes.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._rows = {}
+        self._classes = {}
+        self.backend = None
+
+    def lookup(self, vowel, rhymescheme, more=0):
+        row = self._rows.get((rhymescheme, more))
+        if row is None:
+            row = self._build_row(rhymescheme, more)
+        return row[vowel]
+
+    def classes(self, rhymescheme, more=0):
+        """
+        RhymeClasses of a row: the bitmask of the rhymes of every vowel, and
+        whether the row partitions the vowels into classes, in which case
+        two vowels rhyme exactly when their masks are equal.
+        """
+        classes = self._classes.get((rhymescheme, more))
+        if classes is None:
+            row = self._rows.get((rhymescheme, more))
+            if row is None:
+                row = self._build_row(rhymescheme, more)
+            masks = {k: vowel_mask(v) for (k, v) in row.items()}
+            transitive = all(
+                masks[x] >> x._value_ & 1 and
+                all(masks[y] == masks[x] for y in row[x])
+                for x in Vowel if x is not Vowel.Empty
+            )
+            classes = RhymeClasses(masks, transitive)
+            self._classes[(rhymescheme, more)] = classes
+        return classes
+
+    def add_row(self, rhymescheme, more, row):
+        self._rows[(rhymescheme, more)] = row
+        self._classes.pop((rhymescheme, more), None)
+
+    def clear(self):
+        self._rows.clear()
+        self._classes.clear()
+
+    def _build_row(self, rhymescheme, more):
+        row = None
+        if self.backend is not None:
+            row = self.backend.build_row(rhymescheme, more)
+        if row is None:
+            row = {Vowel.Empty: frozenset()}
+            for vowel in Vowel:
+                if vowel is Vowel.Empty:
+                    continue
+                rhymes = vowel._rhyme(
+                    rhymescheme, more=more, model=self.model
+                )
+                row[vowel] = None if rhymes is None else frozenset(rhymes)
+        self.add_row(rhymescheme, more, row)
+        return row
+
+
+VOWEL_LOOKUP = {None: Vowel.Empty, '': Vowel.Empty}
+for _vowel in Vowel:
+    VOWEL_LOOKUP[_vowel] = _vowel
+    VOWEL_LOOKUP[_vowel.name] = _vowel
+    VOWEL_LOOKUP[_vowel._value_] = _vowel
+for (_spelling, _name) in VOWEL_TRANSLATION.items():
+    VOWEL_LOOKUP[_spelling] = Vowel[_name]
+
+_RHYME_TABLES = {}
+
+
+@dataclass(frozen=True)
+class PhoneticModel(object):
+    """
+    Coordinates, weights and thresholds behind the similarity schemes.
+
+    `coordinates` maps monophthong names to (openness, backness), overriding
+    those of Monophthong. Thresholds are (base, step) pairs, growing by one
+    step per `more` level, and `sounding` is the (scale, offset) applied to
+    `more` before SIMILAR_SOUNDING compares bodies and tails. Each distinct
+    model gets its own rhyme table, built lazily and kept for reuse.
+    """
+    coordinates: tuple = ()
+    ratios: tuple = (8, 1)
+    similar: tuple = (0.1, 0.1)
+    sounding: tuple = (0.75, 0.25)
+    movement: tuple = (0.15, 0.15)
+    _positions: dict = field(init=False, repr=False, compare=False)
+    _movements: dict = field(init=False, repr=False, compare=False)
+    _table: list = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        positions = {x.name: x.value for x in Monophthong}
+        positions.update(dict(self.coordinates))
+        object.__setattr__(
+            self, 'coordinates', tuple(sorted(positions.items()))
+        )
+        object.__setattr__(self, '_positions', positions)
+        object.__setattr__(self, '_movements', {})
+        object.__setattr__(self, '_table', [])
+
+    def position(self, name):
+        return self._positions[name]
+
+    def similar_threshold(self, more):
+        base, step = self.similar
+        return base + more * step
+
+    def sounding_more(self, more):
+        scale, offset = self.sounding
+        return more * scale + offset
+
+    def movement_threshold(self, more):
+        base, step = self.movement
+        return base + more * step
+
+    def mouth_movements(self, threshold):
+        """
+        MouthMovement of every vowel at `threshold`, and the vowels of every
+        movement, computed once per threshold.
+        """
+        movements = self._movements.get(threshold)
+        if movements is None:
+            classes = {
+                x: MouthMovement.classify(x, self._positions, threshold)
+                for x in Vowel
+            }
+            members = {}
+            for (vowel, movement) in classes.items():
+                members.setdefault(movement, set()).add(vowel)
+            movements = (
+                classes, {k: frozenset(v) for (k, v) in members.items()}
+            )
+            self._movements[threshold] = movements
+        return movements
+
+    def preload_movements(self, mores=range(3)):
+        """
+        Classify the mouth movements for several `more` levels up front.
+        """
+        for more in mores:
+            self.mouth_movements(self.movement_threshold(more))
+
+    def similar_to(self, value, threshold):
+        """
+        Names of the monophthongs closer than `threshold` to a position.
+        """
+        return {
+            name for (name, position) in self._positions.items() if (
+                math.hypot(
+                    *[abs(a - b) for (a, b) in zip(position, value)]
+                ) < threshold
+            )
+        }
+
+    def altered_nucleus(self, vowel):
+        body = self.position(vowel.nucleus)
+        if not vowel.coda:
+            return body
+        tail = self.position(vowel.coda)
+        return tuple(
+            Multiphthong._weighted_average(x, self.ratios)
+            for x in zip(body, tail)
+        )
+
+    @property
+    def rhyme_table(self):
+        if not self._table:
+            table = _RHYME_TABLES.setdefault(self, RhymeTable(self))
+            self._table.append(table)
+        return self._table[0]
+
+
+DEFAULT_MODEL = PhoneticModel()
+RHYME_TABLE = DEFAULT_MODEL.rhyme_table
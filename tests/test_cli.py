@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+
+from pinyin_rhymer.cli import main
+from pinyin_rhymer.pinyin import PinYin
+
+
+def _run(argv, stdin=''):
+    stdout = io.StringIO()
+    code = main(argv, io.StringIO(stdin), stdout)
+    return code, stdout.getvalue().splitlines()
+
+
+def test_query():
+    code, lines = _run(['shuang1', '-c', 'FAMILY', '-v', 'FOURTEEN_RHYMES'])
+    assert code == 0
+    query, rhymes = lines[0].split('\t')
+    assert query == 'shuang1'
+    assert set(rhymes.split()) == {
+        'fang1', 'hang1', 'huang1', 'sang1', 'shang1', 'shuang1', 'xiang1'
+    }
+
+
+def test_stdin_json():
+    code, lines = _run(
+        ['--format', 'json', '-t', 'ALL', '--top', '3', '--tone-marks'],
+        'ai4\n\nbar\nai4\n'
+    )
+    records = [json.loads(x) for x in lines]
+    assert code == 1
+    assert [x['query'] for x in records] == ['ai4', 'bar', 'ai4']
+    expect = PinYin('ai4').rank_rhymes(tones='ALL', top=3)
+    assert records[0]['rhymes'] == [x.with_tone_mark() for x in expect]
+    assert 'error' in records[1]
+    assert records[2] == records[0]
+
+
+def test_stdin_dash():
+    code, lines = _run(['-', '-v', 'NOT_A_SCHEME'], 'ai4\n')
+    assert code == 1
+    assert lines[0].startswith('ai4\terror: ')
+
+
+def test_stdin_lone_consonant():
+    code, lines = _run(['-t', 'ALL'], 'ai4\nb\nhao3\n')
+    assert code == 1
+    assert [x.split('\t')[0] for x in lines] == ['ai4', 'b', 'hao3']
+    assert lines[1].startswith('b\terror: ')
+    assert 'error' not in lines[2]
+
+
+def test_tones():
+    _, comma = _run(['ai4', '-t', '1,4'])
+    _, digits = _run(['ai4', '-t', '14'])
+    assert comma == digits
+    assert 'error' not in comma[0]
+    with pytest.raises(SystemExit):
+        _run(['ai4', '-t', '1,x'])
@@ -0,0 +1,34 @@
+import pytest
+
+from pinyin_rhymer.compact import CompactPinYin, encode
+from pinyin_rhymer.consonant import Consonant
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.vowel import Vowel
+
+
+@pytest.mark.parametrize(
+    'source', ['a5', 'bǒ', 'lüè', 'zhao1', 'chuāng', 'shi4', 'yu3', 'ěr']
+)
+def test_round_trip(source):
+    pinyin = PinYin(source)
+    compact = CompactPinYin(source)
+    assert compact == CompactPinYin(pinyin)
+    assert compact == CompactPinYin(int(compact))
+    assert compact.to_pinyin() == pinyin
+    assert compact.consonant == pinyin.consonant
+    assert compact.vowel is pinyin.vowel
+    assert compact.tone == pinyin.tone
+    assert str(compact) == str(pinyin)
+    assert compact.with_tone_mark() == pinyin.with_tone_mark()
+    assert eval(repr(compact)) == compact
+
+
+def test_encode():
+    assert CompactPinYin('ba4') == encode(Consonant.b, Vowel.a, 4)
+    assert CompactPinYin('ba4') != CompactPinYin('ba3')
+    assert len({CompactPinYin('ba4'), CompactPinYin('bà')}) == 1
+
+
+def test_slots():
+    with pytest.raises(AttributeError):
+        CompactPinYin('ba4').__dict__
@@ -1,6 +1,9 @@
 import pytest
 
-from pinyin_rhymer.consonant import Consonant, ConsonantFamily
+from pinyin_rhymer.consonant import (
+    ALL_CONSONANTS, FAMILY_MASKS, Consonant, ConsonantFamily, consonant_mask,
+    consonants_of
+)
 from pinyin_rhymer.error import NotAConsonantError
 
 CONSONANT_FAMILIES = {
@@ -56,3 +59,28 @@ def test_not_a_consonant_error():
     with pytest.raises(NotAConsonantError) as excinfo:
         Consonant('not a consonant')
     assert 'not a consonant' in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    ('name, consonant'), [
+        ('zh', Consonant.zh),
+        ('Z', Consonant.zh),
+        ('S', Consonant.sh),
+        ('', Consonant.Empty),
+        (None, Consonant.Empty),
+        (Consonant.b, Consonant.b),
+        ('not a consonant', None),
+        (['b'], None),
+    ]
+)
+def test_lookup(name, consonant):
+    assert Consonant.lookup(name) is consonant
+
+
+def test_consonant_mask():
+    mask = consonant_mask([Consonant.b, Consonant.zh, Consonant.b])
+    assert consonants_of(mask) == (Consonant.b, Consonant.zh)
+    assert consonants_of(ALL_CONSONANTS) == tuple(Consonant)
+    assert set(consonants_of(FAMILY_MASKS[Consonant.b.family])) == (
+        Consonant.b.all_family()
+    )
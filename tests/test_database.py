@@ -0,0 +1,76 @@
+import pytest
+
+from pinyin_rhymer.data.database import (
+    CharacterIndex, ReadingIndex, SyllableDatabase
+)
+
+ROWS = [
+    ('zhōng', 3, '中忠钟'), ('zhòng', 2, '中重'), ('ā', 2, '阿啊'),
+    ('lǜ', 1, '绿')
+]
+
+
+@pytest.fixture(params=['memory', 'mmap'])
+def database(request, tmp_path):
+    database = SyllableDatabase.from_rows(ROWS, signature=7)
+    if request.param == 'mmap':
+        path = tmp_path / 'syllables.bin'
+        path.write_bytes(database._buffer)
+        database = SyllableDatabase.open(path)
+    return database
+
+
+def test_mapping(database):
+    assert database.signature == 7
+    assert len(database) == 4
+    assert list(database) == ['zhōng', 'zhòng', 'ā', 'lǜ']
+    assert database['lǜ'] == '绿'
+    assert 'ā' in database.keys()
+    assert 'a' not in database
+    assert 1 not in database
+    with pytest.raises(KeyError):
+        database['a']
+
+
+def test_counts(database):
+    assert database.count('zhōng') == 3
+    assert list(database.counts()) == [
+        ('zhōng', 3), ('zhòng', 2), ('ā', 2), ('lǜ', 1)
+    ]
+    with pytest.raises(KeyError):
+        database.count('a')
+
+
+def test_views(database):
+    i = database.find('ā')
+    assert i == 2
+    assert bytes(database.zi_view(i)) == '阿啊'.encode('utf-8')
+    assert database.find('zhong') == -1
+
+
+def test_characters(database):
+    assert database.characters('zhòng') == ('中', '重')
+    assert database.characters('zhong') == ()
+    assert database.readings('中') == ('zhōng', 'zhòng')
+    assert database.readings('绿') == ('lǜ',)
+    assert database.readings('我') == ()
+    assert database.readings('中重') == ()
+    assert list(database.iter_characters()) == sorted('中忠钟重阿啊绿')
+
+
+def test_indexes(database):
+    characters = CharacterIndex(database)
+    readings = ReadingIndex(database)
+    assert dict(characters)['ā'] == ('阿', '啊')
+    assert len(readings) == 7
+    assert readings['重'] == ('zhòng',)
+    assert readings.get('我') is None
+    with pytest.raises(KeyError):
+        characters['zhong']
+
+
+def test_not_a_database():
+    with pytest.raises(ValueError):
+        SyllableDatabase(b'\0' * 64)
+    with pytest.raises(ValueError):
+        SyllableDatabase(b'PYDB')
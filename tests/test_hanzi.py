@@ -0,0 +1,65 @@
+import io
+
+import pytest
+
+from pinyin_rhymer import hanzi, rhyme_with
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.stream import read_chunks
+
+
+@pytest.mark.parametrize(
+    ('text, pinyin'), [
+        ('我爱你', ['wo3', 'ai4', 'ni3']),
+        ('世界，你！', ['shi4', 'jie4', 'ni3']),
+        ('abc 123', []),
+        ('', []),
+    ]
+)
+def test_convert(text, pinyin):
+    assert hanzi.convert(text) == [PinYin(x) for x in pinyin]
+
+
+def test_polyphone():
+    readings = hanzi.readings('乐')
+    assert [str(x) for x in readings] == ['le4', 'yue4', 'yao4', 'lao4']
+    assert hanzi.convert('乐') == [readings[0]]
+    assert hanzi.convert('乐', all_readings=True) == [readings]
+
+
+@pytest.mark.parametrize(
+    'zi, default', [
+        ('的', 'de5'), ('了', 'le5'), ('着', 'zhe5'), ('还', 'hai2'),
+        ('说', 'shuo1'), ('都', 'dou1'), ('调', 'diao4'), ('参', 'can1'),
+        ('似', 'si4'), ('弹', 'tan2'), ('曲', 'qu3'), ('什', 'shen2'),
+    ]
+)
+def test_default_reading(zi, default):
+    assert hanzi.convert(zi) == [PinYin(default)]
+
+
+def test_default_readings_listed():
+    for (zi, default) in hanzi.DEFAULT_READINGS.items():
+        assert hanzi.readings(zi)[0] == default
+
+
+def test_readings_missing():
+    assert hanzi.readings('a') == ()
+
+
+def test_convert_batch():
+    assert hanzi.convert_batch(['我', '你']) == {
+        '我': [PinYin('wo3')], '你': [PinYin('ni3')]
+    }
+
+
+def test_iter_convert():
+    chunks = read_chunks(io.StringIO('我爱你' * 3), size=2)
+    assert list(hanzi.iter_convert(chunks)) == hanzi.convert('我爱你' * 3)
+
+
+def test_line_ending():
+    ending = hanzi.line_ending('我爱你。')
+    assert ending == PinYin('ni3')
+    rhymes = set(rhyme_with(ending, 'ALL', 'FOURTEEN_RHYMES', None))
+    assert PinYin('li3') in rhymes
+    assert hanzi.line_ending('...') is None
@@ -0,0 +1,74 @@
+import pytest
+
+from pinyin_rhymer.index import RhymeIndex, build_index, line_ending
+from pinyin_rhymer.pinyin import PinYin
+
+CORPUS = [
+    'wo3 de ai4',
+    'ni3 zai4 na3 li3',
+    'ming2 tian1 hui4 geng4 hao3 ba',
+    'xiang3 ni3 de ye4 wan3',
+    'yi2 ge4 ren2 zou3 zai4 jie1 shang4',
+    'kai1 huai2',
+    '你好',
+    'shi2 jian1 guo4 de hao3 kuai4',
+    'chuāng qián míng yuè guāng',
+    'wan4 wu4 sheng1 zhang3',
+]
+
+
+def test_line_ending():
+    assert line_ending('chuāng qián míng yuè guāng！') == 'guang1'
+    assert line_ending('kai1 huai2 hm') == 'huai2'
+    assert line_ending('你好') is None
+    assert line_ending('wo3 ai4 xiànzài') == 'zai4'
+    assert line_ending('wo ai Ān') == 'an1'
+    assert line_ending('K ge4 wang2 b') == 'wang2'
+
+
+def test_build_index_lone_consonants(tmp_path):
+    path = tmp_path / 'corpus.idx'
+    entries = ['K ge4 wang2 ba', 'b k', 'ni3 men hao3 b']
+    build_index(entries, path, processes=1)
+    with RhymeIndex(path) as index:
+        assert list(index.rhymes('hao3')) == ['ni3 men hao3 b']
+        assert list(index.rhymes('ba1', tones='ALL')) == ['K ge4 wang2 ba']
+
+
+@pytest.fixture(params=[1, 2], ids=['inline', 'pool'])
+def index(request, tmp_path):
+    path = tmp_path / 'corpus.idx'
+    build_index(CORPUS, path, processes=request.param, shard_size=3)
+    with RhymeIndex(path) as index:
+        yield index
+
+
+def test_entries(index):
+    assert len(index) == len(CORPUS)
+    assert [index[i] for i in range(len(index))] == CORPUS
+    with pytest.raises(IndexError):
+        index[len(CORPUS)]
+
+
+@pytest.mark.parametrize(
+    'source, schemes', [
+        ('ai4', ('ALL', 'SIMILAR_SOUNDING', None)),
+        ('ai4', ('ALL', 'FOURTEEN_RHYMES', 'ALL')),
+        ('zang4', ('FAMILY', 'SIMILAR_TAIL', 'ALL')),
+        ('li3', ('ALL', 'SIMILAR_SOUNDING', None)),
+    ]
+)
+def test_rhymes(index, source, schemes):
+    consonants, vowels, tones = schemes
+    source = PinYin(source)
+    expect = set(source.generate_rhymes(consonants, vowels, tones))
+    assert set(index.rhymes(source, *schemes)) == {
+        x for x in CORPUS if line_ending(x) in expect
+    }
+
+
+def test_not_an_index(tmp_path):
+    path = tmp_path / 'corpus.idx'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        RhymeIndex(path)
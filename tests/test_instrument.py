@@ -0,0 +1,77 @@
+import pytest
+
+from pinyin_rhymer import instrument, rhyme_with
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.vowel import Vowel
+
+
+@pytest.fixture
+def instrumented():
+    instrument.reset()
+    yield instrument
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled():
+    parse = PinYin.__dict__['_parse']
+    rhyme = Vowel.__dict__['rhyme']
+    instrument.enable()
+    assert instrument.report()['enabled']
+    assert PinYin.__dict__['_parse'] is not parse
+    instrument.disable()
+    assert not instrument.report()['enabled']
+    assert PinYin.__dict__['_parse'] is parse
+    assert Vowel.__dict__['rhyme'] is rhyme
+
+
+def test_timings(instrumented):
+    instrumented.enable()
+    PinYin('shuang1').is_valid
+    PinYin('ai4').is_valid
+    Vowel.ai.rhyme('FOURTEEN_RHYMES')
+    timings = instrumented.report()['timings']
+    assert timings['parse']['calls'] == 2
+    assert timings['is_valid']['calls'] == 2
+    assert timings['rhyme.FOURTEEN_RHYMES']['calls'] == 1
+    assert timings['parse']['seconds'] >= 0
+
+
+def test_candidates(instrumented):
+    instrumented.enable()
+    rhymes = list(PinYin('ai4').generate_rhymes('FAMILY', 'ai', 'ALL'))
+    report = instrumented.report()
+    assert report['candidates']['tried'] == 5
+    assert report['candidates']['yielded'] == len(rhymes)
+    assert report['timings']['generate_rhymes']['calls'] == 1
+
+
+def test_caches(instrumented):
+    instrumented.enable()
+    Vowel.ai.rhyme('SIMILAR_SOUNDING')
+    Vowel.ai.rhyme('SIMILAR_SOUNDING')
+    caches = instrumented.report()['caches']
+    assert caches['rhyme_table']['hits'] >= 1
+    assert 0 <= caches['rhyme_table']['hit_rate'] <= 1
+    assert 0 <= caches['parse']['hit_rate'] <= 1
+
+
+def test_scheme_resolution(instrumented):
+    instrumented.enable()
+    source = PinYin('ai4')
+    list(source.generate_rhymes('ALL', 'FOURTEEN_RHYMES', 'ALL'))
+    list(rhyme_with('kai1', 'FAMILY', 'SIMILAR_TAIL', None))
+    source.rhymes_with('tai4', 'ALL', 'SIMILAR_SOUNDING')
+    report = instrumented.report()
+    table = report['caches']['rhyme_table']
+    assert table['hits'] >= 0
+    assert table['hits'] + table['misses'] >= 3
+    assert report['timings']['rhyme.FOURTEEN_RHYMES']['calls'] == 1
+    assert report['timings']['rhyme.SIMILAR_TAIL']['calls'] == 1
+
+
+def test_hook(instrumented):
+    events = []
+    instrumented.enable(hook=lambda *x: events.append(x))
+    PinYin('ai4')
+    assert [x[0] for x in events] == ['parse']
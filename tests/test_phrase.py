@@ -0,0 +1,69 @@
+import pytest
+
+from pinyin_rhymer.phrase import Phrase, RhymeScheme
+from pinyin_rhymer.pinyin import PinYin
+
+
+def test_parse():
+    phrase = Phrase('xiàn zài')
+    assert phrase == Phrase(['xian4', PinYin('zai4')])
+    assert phrase == 'xian4 zai4'
+    assert len(phrase) == 2
+    assert phrase[-1] is PinYin.intern('zai4')
+    assert eval(repr(phrase)) == phrase
+
+
+@pytest.mark.parametrize('other', [None, 1, 'not pinyin', ['xyz']])
+def test_not_equal(other):
+    assert Phrase('xian4 zai4') != other
+    assert not Phrase('xian4 zai4') == other
+
+
+@pytest.mark.parametrize(
+    'this, other, schemes, length, expect', [
+        ('xian4 zai4', 'lian4 ai4', RhymeScheme(), None, True),
+        ('xian4 zai4', 'lian4 ai3', RhymeScheme(), None, False),
+        ('xian4 zai4', 'lian4 ai3', RhymeScheme(tones='ALL'), None, True),
+        ('xian4 zai4', 'hao3 ai4', RhymeScheme(), 1, True),
+        ('xian4 zai4', 'ai4', RhymeScheme(), 2, False),
+        ('xian4 zai4', 'tian1 ai4', [
+            RhymeScheme(tones='ALL'), RhymeScheme()
+        ], None, True),
+        ('xian4 zai4', 'tian1 ai4', [
+            RhymeScheme(), RhymeScheme(tones='ALL')
+        ], None, False),
+        ('xian4 zai4', 'lian4 zai3', RhymeScheme(
+            ['b', 'l', 'z'], ['ai', 'ian'], [3, 4]
+        ), None, True),
+        ('xian4 zai4', 'mian4 zai2', [
+            ('ALL', 'SIMILAR_SOUNDING', [4]), (['z', 'x'], ['ai'], 'ALL')
+        ], None, True),
+    ]
+)
+def test_rhymes_with(this, other, schemes, length, expect):
+    assert Phrase(this).rhymes_with(other, schemes, length) is expect
+
+
+def test_generate_rhymes():
+    phrase = Phrase('wo3 xian4 zai4')
+    scheme = RhymeScheme('bpmf', 'FOURTEEN_RHYMES')
+    rhymes = set(phrase.generate_rhymes(scheme, 2))
+    first = set(PinYin('xian4').generate_rhymes('bpmf', 'FOURTEEN_RHYMES'))
+    last = set(PinYin('zai4').generate_rhymes('bpmf', 'FOURTEEN_RHYMES'))
+    assert rhymes == {
+        Phrase(['wo3', x, y]) for x in first for y in last
+    }
+    assert all(phrase.rhymes_with(x, scheme, 2) for x in rhymes)
+
+
+def test_find_rhymes():
+    phrase = Phrase('xian4 zai4')
+    lexicon = ['lian4 ai4', 'hao3 ai4', 'ai4', 'bian4 huai4', 'tian1 kong1']
+    assert list(phrase.find_rhymes(lexicon)) == [
+        Phrase('lian4 ai4'), Phrase('bian4 huai4')
+    ]
+
+
+def test_too_long():
+    with pytest.raises(ValueError):
+        Phrase('zai4').rhymes_with('zai4', length=2)
@@ -1,10 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 import pytest
 
 from pinyin_rhymer.consonant import Consonant
 from pinyin_rhymer.error import NotAPinYinError, IrregularPinYinError
-from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.pinyin import (
+    SYLLABLE_TABLE, VALIDITY_INDEX, ParseCache, PinYin, group_rhymes,
+    is_transitive, match_pinyin
+)
 from pinyin_rhymer.vowel import Vowel
 
 
@@ -42,6 +46,7 @@ class PinyinCase(Enum):
     yong1 = ('yōng', '', 'yong', 'iong', 'i', 'o', 'ng', 1)
     yi1 = ('yī', '', 'yi', 'i', '', 'i', '', 1)
     yu3 = ('yǔ', '', 'yu', 'v', '', 'v', '', 3)
+    yue4 = ('yuè', '', 'yue', 'ue', 'v', 'e', '', 4)
     er3 = ('ěr', '', 'er', 'er', '', 'ɚ', '', 3)
 
     def __new__(
@@ -154,6 +159,8 @@ def test_rhymes_with(this, other, options):
         'not a pinyin',
         'wah3',
         'bar',
+        'b',
+        'sh4',
     ]
 )
 def test_not_a_pinyin_error(input):
@@ -189,3 +196,189 @@ def test_irregular_pinyin(pinyin_str):
     with pytest.raises(IrregularPinYinError) as excinfo:
         PinYin(pinyin_str)
     assert pinyin_str in str(excinfo.value)
+
+
+def test_intern(pinyin_case):
+    pinyin = PinYin.intern(pinyin_case.unicode)
+    assert pinyin is PinYin.intern(pinyin_case.unicode)
+    assert pinyin is PinYin.intern(pinyin_case.name)
+    assert pinyin is PinYin.intern(
+        pinyin_case.consonant, pinyin_case.vowel, pinyin_case.tone
+    )
+    assert pinyin == PinYin(pinyin_case.unicode)
+
+
+def test_immutable():
+    pinyin = PinYin.intern('ba4')
+    with pytest.raises(AttributeError):
+        pinyin.tone = 3
+    with pytest.raises(AttributeError):
+        del pinyin.vowel
+    assert pinyin.tone == 4
+
+
+@pytest.mark.parametrize(
+    'eviction, expect', [
+        ('LRU', ['ba1', 'ba3']),
+        ('FIFO', ['ba2', 'ba3']),
+    ]
+)
+def test_parse_cache_eviction(eviction, expect):
+    cache = ParseCache(maxsize=2, eviction=eviction)
+    for each in ('ba1', 'ba2'):
+        cache.put(each, PinYin(each))
+    assert cache.get('ba1') == 'ba1'
+    cache.put('ba3', PinYin('ba3'))
+    assert sorted(cache._entries) == expect
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_parse_cache_configure():
+    cache = ParseCache(maxsize=3)
+    for each in ('ba1', 'ba2', 'ba3'):
+        cache.put(each, PinYin(each))
+    cache.configure(maxsize=1)
+    assert list(cache._entries) == ['ba3']
+    with pytest.raises(ValueError):
+        cache.configure(eviction='RANDOM')
+
+
+def test_parse_cache_threads():
+    cache = ParseCache(maxsize=4)
+    spellings = [f'ba{x}' for x in range(1, 6)]
+    pinyins = {x: PinYin(x) for x in spellings}
+
+    def churn(offset):
+        for i in range(2000):
+            each = spellings[(i + offset) % len(spellings)]
+            if cache.get(each) is None:
+                cache.put(each, pinyins[each])
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(churn, range(8)))
+    assert len(cache) == 4
+    assert cache.hits + cache.misses == 8 * 2000
+
+
+def test_validity_index():
+    for consonant in Consonant:
+        for vowel in Vowel:
+            if vowel is Vowel.Empty:
+                assert not VALIDITY_INDEX.tones(consonant, vowel)
+                continue
+            for tone in range(1, 6):
+                pinyin = PinYin(consonant, vowel, tone)
+                assert pinyin.is_valid is pinyin._is_listed()
+
+
+def test_validity_index_tones():
+    assert VALIDITY_INDEX.tones(Consonant.b, Vowel.a) == 0b111110
+    assert VALIDITY_INDEX.tones(Consonant.b, Vowel.yong) == 0
+    assert VALIDITY_INDEX.is_valid(Consonant.b, Vowel.a, 9) is False
+
+
+def test_characters():
+    assert PinYin('le4').characters[:3] == ('乐', '仂', '勒')
+    assert PinYin('bong1').characters == ()
+
+
+def test_count():
+    assert PinYin('a1').count == 7
+    assert PinYin('bong1').count == 0
+
+
+@pytest.mark.parametrize('top', [None, 1, 5, 1000])
+def test_rank_rhymes(top):
+    pinyin = PinYin('ai4')
+    ranked = pinyin.rank_rhymes('ALL', 'SIMILAR_SOUNDING', 'ALL', top=top)
+    rhymes = set(pinyin.generate_rhymes('ALL', 'SIMILAR_SOUNDING', 'ALL'))
+    scores = [pinyin.rhyme_score(x) for x in ranked]
+    assert scores == sorted(scores)
+    assert len(ranked) == min(top or len(rhymes), len(rhymes))
+    assert set(ranked) <= rhymes
+    if top:
+        assert ranked == pinyin.rank_rhymes(
+            'ALL', 'SIMILAR_SOUNDING', 'ALL'
+        )[:top]
+
+
+def test_rank_rhymes_weight():
+    pinyin = PinYin('ai4')
+    ranked = pinyin.rank_rhymes('ALL', 'SIMILAR_SOUNDING', 'ALL', weight=0)
+    distances = [pinyin.vowel.distance(x.vowel) for x in ranked]
+    assert distances == sorted(distances)
+
+
+def test_syllable_table():
+    SYLLABLE_TABLE.load()
+    for (spelling, parsed) in SYLLABLE_TABLE._table.items():
+        consonant, vowel, tone = match_pinyin(spelling)
+        assert parsed == (Consonant(consonant), Vowel(vowel), int(tone))
+
+
+@pytest.mark.parametrize(
+    ('spelling, listed'), [
+        ('shuang1', True),
+        ('shuāng', True),
+        ('lüè', True),
+        ('lvè', True),
+        ('nü3', True),
+        ('zhi', True),
+        ('a0', False),
+        ('Zhi1', False),
+        ('hm', False),
+    ]
+)
+def test_syllable_table_fallback(spelling, listed):
+    assert (SYLLABLE_TABLE.get(spelling) is not None) == listed
+
+
+@pytest.mark.parametrize(
+    ('scheme, transitive'), [
+        ('FOURTEEN_RHYMES', True),
+        ('SIMILAR_MOUTH_MOVEMENT', True),
+        ('SIMILAR_BODY', False),
+        ('ADDITIVE', False),
+    ]
+)
+def test_is_transitive(scheme, transitive):
+    assert is_transitive(scheme) is transitive
+
+
+@pytest.mark.parametrize('consonants', ['ALL', 'FAMILY'])
+@pytest.mark.parametrize('tone', ['SAME', 'ALL'])
+def test_rhyme_key(consonants, tone):
+    syllables = [PinYin(x) for x in ('ai4', 'kuai4', 'bai3', 'dei3', 'pa4')]
+    for this in syllables:
+        for other in syllables:
+            assert (
+                this.rhyme_key(consonants, 'FOURTEEN_RHYMES', tone) ==
+                other.rhyme_key(consonants, 'FOURTEEN_RHYMES', tone)
+            ) == this.rhymes_with(other, consonants, 'FOURTEEN_RHYMES', tone)
+
+
+def test_rhyme_key_neighbours():
+    key = PinYin('ai4').rhyme_key(vowel_scheme='SIMILAR_BODY')
+    rhymes = Vowel.ai.rhyme('SIMILAR_BODY')
+    assert key.vowels == sum(1 << x._value_ for x in rhymes)
+
+
+def test_group_rhymes():
+    syllables = ['ai4', 'kuai1', 'dei3', 'shuang1', 'wang2']
+    groups = group_rhymes(syllables, 'ALL', 'FOURTEEN_RHYMES', 'ALL')
+    assert sorted(sorted(map(str, x)) for x in groups.values()) == [
+        ['ai4', 'kuai1'], ['dei3'], ['shuang1', 'wang2']
+    ]
+
+
+def test_combined_schemes():
+    pinyin = PinYin('ai4')
+    combined = set(
+        pinyin._get_vowel_list(('FOURTEEN_RHYMES', 'SIMILAR_TAIL', 'ou'))
+    )
+    assert combined == (
+        Vowel.ai.rhyme('FOURTEEN_RHYMES') | Vowel.ai.rhyme('SIMILAR_TAIL') |
+        {Vowel.ou}
+    )
+    rhymes = list(pinyin.generate_rhymes(('FAMILY', 'b', 'b'), 'ai'))
+    assert rhymes == [PinYin('bai4'), PinYin('ai4')]
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+from pinyin_rhymer.data import pinyin_list
+
+
+def test_compiled_matches_csv():
+    database = pinyin_list._open_compiled()
+    rows = pinyin_list.read_csv()
+    assert database is not None
+    assert list(database.items()) == [(x[0], x[2]) for x in rows]
+    assert list(database.counts()) == [(x[0], x[1]) for x in rows]
+
+
+def test_lazy_attributes():
+    zi_dict = pinyin_list.PINYIN_ZI_DICT
+    assert zi_dict is pinyin_list.load()
+    assert pinyin_list.PINYIN_LIST == zi_dict.keys()
+    assert zi_dict['ā'] == '吖呵啊腌錒锕阿'
+
+
+def test_import_does_not_load_data():
+    code = (
+        'import pinyin_rhymer, sys;'
+        'print(sys.modules["pinyin_rhymer.data.pinyin_list"]._database)'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True
+    )
+    assert result.stdout.strip() == 'None'
+
+
+def test_indexes():
+    pinyin_zi = pinyin_list.PINYIN_ZI_INDEX
+    zi_pinyin = pinyin_list.ZI_PINYIN_INDEX
+    assert pinyin_zi is pinyin_list.PINYIN_ZI_INDEX
+    assert pinyin_zi['ā'] == ('吖', '呵', '啊', '腌', '錒', '锕', '阿')
+    assert zi_pinyin['乐'] == ('lào', 'lè', 'yào', 'yuè')
+    for pinyin, zi in pinyin_list.PINYIN_ZI_DICT.items():
+        assert ''.join(pinyin_zi[pinyin]) == zi
+        assert all(pinyin in zi_pinyin[x] for x in zi)
+
+
+def test_same_size_edit_is_stale(monkeypatch, tmp_path):
+    source = pinyin_list.pinyin_file.read_bytes()
+    edited = tmp_path / 'pinyin_list.csv'
+    edited.write_bytes(source.replace('阿'.encode(), '啊'.encode(), 1))
+    assert edited.stat().st_size == len(source)
+    monkeypatch.setattr(pinyin_list, 'pinyin_file', edited)
+    assert pinyin_list._open_compiled() is None
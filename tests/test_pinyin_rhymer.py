@@ -1,5 +1,17 @@
-from pinyin_rhymer import __version__
+from pinyin_rhymer import __version__, generate_rhymes_batch, rhyme_with
 
 
 def test_version():
     assert __version__ == '0.1.8'
+
+
+def test_generate_rhymes_batch():
+    sources = ['shuang1', 'zhe5', 'shuang1', 'shuāng', 'ba4']
+    results = generate_rhymes_batch(sources, 'FAMILY', 'FOURTEEN_RHYMES', None)
+    assert list(results) == ['shuang1', 'zhe5', 'shuāng', 'ba4']
+    for source in results:
+        expect = tuple(
+            rhyme_with(source, 'FAMILY', 'FOURTEEN_RHYMES', None)
+        )
+        assert results[source] == expect
+    assert results['shuang1'] is results['shuāng']
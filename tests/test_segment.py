@@ -0,0 +1,38 @@
+import pytest
+
+from pinyin_rhymer.error import NotAPinYinError
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.segment import segment, segment_pinyin
+
+
+@pytest.mark.parametrize(
+    ('text, syllables'), [
+        ('xianzaiwomen', ['xian', 'zai', 'wo', 'men']),
+        ('xiān\u200bzài', ['xiān', 'zài']),
+        ("xi'an", ['xi', 'an']),
+        ('xi’an-shi', ['xi', 'an', 'shi']),
+        ('xian1zai4', ['xian1', 'zai4']),
+        ('zhongguorenmin', ['zhong', 'guo', 'ren', 'min']),
+        ('nǚrénlvse', ['nǚ', 'rén', 'lv', 'se']),
+        ('Beijing', ['bei', 'jing']),
+        ('fangan', ['fan', 'gan']),
+        ('  ', []),
+    ]
+)
+def test_segment(text, syllables):
+    assert segment(text) == syllables
+
+
+def test_segment_pinyin():
+    assert segment_pinyin('ni3hao3') == [PinYin('ni3'), PinYin('hao3')]
+
+
+@pytest.mark.parametrize('text', ['xianq', 'bbb', 'ni3hao9'])
+def test_segment_error(text):
+    with pytest.raises(NotAPinYinError):
+        segment(text)
+
+
+def test_segment_long():
+    text = 'xianzaiwomenyiqichangge' * 1000
+    assert len(segment(text)) == 8000
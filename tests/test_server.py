@@ -0,0 +1,101 @@
+import asyncio
+import json
+from urllib.parse import quote
+
+import pytest
+
+from pinyin_rhymer import rhyme_with
+from pinyin_rhymer import server as server_module
+from pinyin_rhymer.server import RhymeServer
+
+
+async def _get(port, target, method='GET'):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f'{method} {target} HTTP/1.1\r\nHost: x\r\n\r\n'.encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, body = response.split(b'\r\n\r\n', 1)
+    return int(head.split()[1]), json.loads(body)
+
+
+def _run(*targets):
+    async def main():
+        server = RhymeServer()
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            responses = [await _get(port, *x) for x in targets]
+        return server, responses
+    return asyncio.run(main())
+
+
+def test_endpoints():
+    server, responses = _run(
+        ('/rhyme?source=ai4&vowels=FOURTEEN_RHYMES&tones=ALL',),
+        ('/rhymes_with?this=ai4&other=kuai4',),
+        ('/characters?pinyin=le4',),
+        (f'/readings?zi={quote("乐")}',),
+        ('/stats',),
+    )
+    expect = rhyme_with('ai4', 'ALL', 'FOURTEEN_RHYMES', 'ALL')
+    assert responses[0] == (200, [str(x) for x in expect])
+    assert responses[1] == (200, True)
+    assert responses[2][1][:3] == ['乐', '仂', '勒']
+    assert responses[3] == (200, ['lè', 'yuè', 'yào', 'lào'])
+    status, stats = responses[4]
+    assert status == 200
+    assert stats['requests'] == 4
+    assert stats['errors'] == 0
+
+
+@pytest.mark.parametrize(
+    'target, method, status', [
+        ('/rhyme?source=bar', 'GET', 400),
+        ('/rhyme?source=b', 'GET', 400),
+        ('/rhyme?source=ai4&tones=9', 'GET', 400),
+        ('/rhyme?source=ai4&tones=1,x', 'GET', 400),
+        ('/rhyme?source=ai4&vowels=NOT_A_SCHEME', 'GET', 400),
+        ('/rhyme', 'GET', 400),
+        ('/nowhere', 'GET', 404),
+        ('/rhyme?source=ai4', 'POST', 405),
+    ]
+)
+def test_errors(target, method, status):
+    server, responses = _run((target, method))
+    assert responses[0][0] == status
+    assert 'error' in responses[0][1]
+    assert server.stats.errors == 1
+
+
+def test_tones():
+    server, responses = _run(
+        ('/rhyme?source=ai4&tones=1,4',), ('/rhyme?source=ai4&tones=14',)
+    )
+    expect = rhyme_with('ai4', 'ALL', 'SIMILAR_SOUNDING', (1, 4))
+    assert responses[0] == (200, [str(x) for x in expect])
+    assert responses[1] == responses[0]
+
+
+def test_internal_error(monkeypatch):
+    def broken(source):
+        raise RuntimeError(source)
+
+    monkeypatch.setitem(server_module.ENDPOINTS, '/rhyme', broken)
+    server, responses = _run(('/rhyme?source=ai4',), ('/stats',))
+    assert responses[0] == (500, {'error': 'RuntimeError: ai4'})
+    assert responses[1][1]['errors'] == 1
+
+
+def test_coalescing():
+    async def main():
+        server = RhymeServer()
+        params = {'source': 'shuang1', 'tones': 'ALL'}
+        results = await asyncio.gather(
+            *(server.dispatch('/rhyme', dict(params)) for _ in range(5))
+        )
+        return server, results
+    server, results = asyncio.run(main())
+    assert server.stats.coalesced == 4
+    assert all(x == results[0] for x in results)
+    assert not server._in_flight
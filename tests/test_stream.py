@@ -0,0 +1,68 @@
+import io
+
+import pytest
+
+from pinyin_rhymer.error import IrregularPinYinError, NotAPinYinError
+from pinyin_rhymer.pinyin import PinYin
+from pinyin_rhymer.stream import (
+    annotate, annotate_file, iter_tokens, read_chunks
+)
+from pinyin_rhymer.vowel import Vowel
+
+TEXT = 'Wǒ ài ni3hao3, hm！ 你好 lüè\nchuāng-qián ńg bar b k'
+TOKENS = [
+    'Wǒ', 'ài', 'ni3', 'hao3', 'hm', 'lüè', 'chuāng', 'qián', 'ńg', 'bar',
+    'b', 'k'
+]
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 1 << 16])
+def test_iter_tokens(size):
+    chunks = read_chunks(io.StringIO(TEXT), size)
+    assert list(iter_tokens(chunks)) == TOKENS
+
+
+def test_annotate():
+    records = list(annotate(TOKENS))
+    assert [x.token for x in records] == TOKENS
+    assert records[0].pinyin is PinYin.intern('wo3')
+    assert records[3].vowel is Vowel.ao
+    assert records[3].tone == 3
+    assert records[3].error is None
+    assert isinstance(records[4].error, IrregularPinYinError)
+    assert isinstance(records[8].error, IrregularPinYinError)
+    assert isinstance(records[9].error, NotAPinYinError)
+    assert records[9].pinyin is None
+    for record in records[10:]:
+        assert isinstance(record.error, NotAPinYinError)
+
+
+@pytest.mark.parametrize(
+    'text, expect', [
+        ('Ài nǐ', ['ai4', 'ni3']),
+        ('Ōu', ['ou1']),
+        ('Ǎ Ě Ǚ', ['a3', 'e3', 'yu3']),
+        ('LǙ LÜ4', ['lv3', 'lv4']),
+        ('ŃG', [None]),
+    ]
+)
+def test_annotate_capitalised(text, expect):
+    records = list(annotate(iter_tokens([text])))
+    assert [x.token for x in records] == text.split()
+    assert [x.pinyin and str(x.pinyin) for x in records] == expect
+
+
+def test_annotate_joined():
+    records = list(annotate(iter_tokens(['Wǒmen xiànzài bar'])))
+    assert [x.token for x in records] == ['Wǒ', 'men', 'xiàn', 'zài', 'bar']
+    assert [str(x.pinyin) for x in records[:4]] == [
+        'wo3', 'men5', 'xian4', 'zai4'
+    ]
+    assert isinstance(records[-1].error, NotAPinYinError)
+
+
+def test_annotate_file(tmp_path):
+    path = tmp_path / 'lyrics.txt'
+    path.write_text(TEXT, encoding='utf-8')
+    records = annotate_file(path, size=4)
+    assert [x.token for x in records] == TOKENS
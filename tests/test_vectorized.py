@@ -0,0 +1,44 @@
+import pytest
+
+from pinyin_rhymer import vectorized
+from pinyin_rhymer.rhyme_scheme import VowelScheme
+from pinyin_rhymer.vowel import DEFAULT_MODEL, RhymeTable, Vowel
+
+pytest.importorskip('numpy')
+
+MORES = [0, 0.5, 1, 1.5, 2, 3]
+
+
+@pytest.mark.parametrize('scheme', vectorized.SCHEMES, ids=lambda x: x.name)
+def test_sweep_matches_python(scheme):
+    rows = vectorized.VowelSpace().sweep(scheme, MORES)
+    for (more, row) in zip(MORES, rows):
+        for vowel in Vowel:
+            if vowel is Vowel.Empty:
+                assert row[vowel] == frozenset()
+                continue
+            assert row[vowel] == vowel._rhyme(scheme, more=more), more
+
+
+def test_backend():
+    table = RhymeTable(DEFAULT_MODEL)
+    vectorized.enable(table)
+    assert table.lookup(Vowel.a, VowelScheme.SIMILAR_SOUNDING) == {
+        Vowel.a, Vowel.ya, Vowel.wa
+    }
+    assert table.lookup(Vowel.a, VowelScheme.ADDITIVE) == (
+        Vowel.a._rhyme(VowelScheme.ADDITIVE)
+    )
+    vectorized.disable(table)
+    assert table.backend is None
+
+
+def test_preload():
+    table = RhymeTable(DEFAULT_MODEL)
+    vectorized.preload(MORES, table)
+    assert len(table._rows) == len(MORES) * len(vectorized.SCHEMES)
+
+
+def test_not_vectorized():
+    with pytest.raises(ValueError):
+        vectorized.VowelSpace().sweep('FOURTEEN_RHYMES', MORES)
@@ -1,7 +1,11 @@
 import pytest
 
 from pinyin_rhymer.error import NotAVowelError
-from pinyin_rhymer.vowel import Vowel
+from pinyin_rhymer.rhyme_scheme import VowelScheme
+from pinyin_rhymer.vowel import (
+    DEFAULT_MODEL, RHYME_TABLE, MouthMovement, PhoneticModel, Vowel,
+    vowel_mask, vowels_of
+)
 
 
 @pytest.mark.parametrize(
@@ -422,3 +426,131 @@ def test_not_a_vowel_error():
     with pytest.raises(NotAVowelError) as excinfo:
         Vowel('not a vowel')
     assert 'not a vowel' in str(excinfo.value)
+
+
+@pytest.mark.parametrize('more', [0, 1])
+@pytest.mark.parametrize(
+    'scheme', [
+        'FOURTEEN_RHYMES',
+        'SIMILAR_BODY',
+        'SIMILAR_TAIL',
+        'SIMILAR_SOUNDING',
+        'SIMILAR_MOUTH_MOVEMENT',
+        'ADDITIVE',
+        'SUBTRACTIVE',
+    ]
+)
+def test_rhyme_table(scheme, more):
+    for vowel in Vowel:
+        if vowel is Vowel.Empty:
+            continue
+        rhymes = vowel.rhyme(scheme, more=more)
+        assert isinstance(rhymes, frozenset)
+        assert rhymes is vowel.rhyme(scheme, more=more)
+        assert rhymes == vowel._rhyme(VowelScheme[scheme], more=more)
+
+
+def test_rhyme_empty():
+    assert Vowel.Empty.rhyme('FOURTEEN_RHYMES') == frozenset()
+
+
+def test_distance():
+    assert Vowel.ai.distance(Vowel.wai) == 0
+    assert Vowel.ai.distance(Vowel.a) == Vowel.a.distance(Vowel.ai)
+    assert Vowel.ai.distance(Vowel.a) < Vowel.ai.distance(Vowel.wu)
+
+
+def test_default_model():
+    assert PhoneticModel() == DEFAULT_MODEL
+    assert PhoneticModel().rhyme_table is RHYME_TABLE
+    assert (
+        Vowel.ai.rhyme('SIMILAR_SOUNDING', model=PhoneticModel()) is
+        Vowel.ai.rhyme('SIMILAR_SOUNDING')
+    )
+
+
+def test_model_tables():
+    model = PhoneticModel(similar=(0.3, 0.1))
+    assert model.rhyme_table is not RHYME_TABLE
+    assert model.rhyme_table is PhoneticModel(similar=(0.3, 0.1)).rhyme_table
+    assert model.rhyme_table.model is model
+    assert (
+        Vowel.ai.rhyme('SIMILAR_TAIL', model=model) ==
+        Vowel.ai.rhyme('SIMILAR_TAIL', more=2)
+    )
+    assert (
+        Vowel.ai.rhyme('FOURTEEN_RHYMES', model=model) ==
+        Vowel.ai.rhyme('FOURTEEN_RHYMES')
+    )
+
+
+def test_model_coordinates():
+    model = PhoneticModel(coordinates={'a': (0.4, 0.5)})
+    assert model.position('a') == (0.4, 0.5)
+    assert model.position('o') == DEFAULT_MODEL.position('o')
+    assert model != DEFAULT_MODEL
+    assert Vowel.ai.distance(Vowel.a, model) != Vowel.ai.distance(Vowel.a)
+    assert (
+        Vowel.a.rhyme('SIMILAR_TAIL', model=model) !=
+        Vowel.a.rhyme('SIMILAR_TAIL')
+    )
+
+
+@pytest.mark.parametrize(
+    ('vowel, movement'), [
+        ('ai', MouthMovement.CLOSE_FRONT),
+        ('ao', MouthMovement.CLOSE_BACK),
+        ('ia', MouthMovement.OPEN_BACK),
+        ('a', MouthMovement.NO_MOVEMENT),
+        ('i', MouthMovement.NO_MOVEMENT),
+    ]
+)
+def test_mouth_movement(vowel, movement):
+    assert MouthMovement.calculate(Vowel(vowel), 0.15) is movement
+
+
+@pytest.mark.parametrize('more', [0, 1, 2])
+def test_mouth_movements(more):
+    threshold = DEFAULT_MODEL.movement_threshold(more)
+    classes, members = DEFAULT_MODEL.mouth_movements(threshold)
+    assert DEFAULT_MODEL.mouth_movements(threshold)[0] is classes
+    assert set(classes) == set(Vowel)
+    for (movement, vowels) in members.items():
+        assert all(classes[x] == movement for x in vowels)
+    assert sum(map(len, members.values())) == len(Vowel)
+
+
+@pytest.mark.parametrize(
+    ('name, vowel'), [
+        ('iang', Vowel.yang),
+        ('yang', Vowel.yang),
+        ('van', Vowel.yuan),
+        ('', Vowel.Empty),
+        (Vowel.ai, Vowel.ai),
+        ('not a vowel', None),
+    ]
+)
+def test_lookup(name, vowel):
+    assert Vowel.lookup(name) is vowel
+
+
+@pytest.mark.parametrize(
+    ('name, scheme'), [
+        ('FOURTEEN_RHYMES', VowelScheme.FOURTEEN_RHYMES),
+        (VowelScheme.ADDITIVE, VowelScheme.ADDITIVE),
+        ('ai, ei', None),
+        (('ai', 'ei'), None),
+    ]
+)
+def test_scheme_lookup(name, scheme):
+    assert VowelScheme.lookup(name) is scheme
+
+
+def test_vowel_mask():
+    rhymes = Vowel.ai.rhyme('FOURTEEN_RHYMES')
+    mask = vowel_mask(rhymes)
+    assert set(vowels_of(mask)) == rhymes
+    assert vowels_of(mask | vowel_mask([Vowel.ei])) == tuple(
+        x for x in Vowel if x in rhymes or x is Vowel.ei
+    )
+    assert vowels_of(0) == ()